@@ -46,11 +46,10 @@ class JudgmentCacheManager:
             return
 
         try:
-            with self.cache_path.open() as f:
-                data = json.load(f)
-                self.cache = JudgmentCache.model_validate(data)
-                logger.debug(f"Loaded {len(self.cache.judgments)} judgments from cache")
-        except (json.JSONDecodeError, ValueError) as e:
+            # Parse and validate straight from JSON bytes inside pydantic-core
+            self.cache = JudgmentCache.model_validate_json(self.cache_path.read_bytes())
+            logger.debug(f"Loaded {len(self.cache.judgments)} judgments from cache")
+        except ValueError as e:
             logger.warning(f"Cache file corrupted, starting with empty cache: {e}")
             self.cache = JudgmentCache()
 
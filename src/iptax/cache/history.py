@@ -7,14 +7,51 @@ The history file is stored in JSON format at ~/.cache/iptax/history.json
 """
 
 import json
+from collections.abc import Mapping
 from datetime import date, datetime
 from pathlib import Path
+from types import MappingProxyType
 
 from pydantic import ValidationError
 
 from iptax.models import HistoryEntry
 from iptax.utils.env import get_cache_dir
 
+YEAR_LENGTH = 4
+MAX_MONTH_LENGTH = 2
+MAX_MONTH = 12
+
+
+def _normalize_month(month: str) -> str:
+    """Validate a month string and normalize it to YYYY-MM.
+
+    Accepts the same ASCII inputs as ``datetime.strptime(month, "%Y-%m")``
+    (a four-digit year and a one- or two-digit month) without building a
+    datetime object.
+
+    Args:
+        month: Month in YYYY-MM format
+
+    Returns:
+        Month key in zero-padded YYYY-MM format
+
+    Raises:
+        ValueError: If month format is invalid
+    """
+    year, sep, month_num = month.partition("-")
+    if (
+        sep
+        and month.isascii()
+        and len(year) == YEAR_LENGTH
+        and year.isdigit()
+        and int(year) > 0
+        and 1 <= len(month_num) <= MAX_MONTH_LENGTH
+        and month_num.isdigit()
+        and 1 <= int(month_num) <= MAX_MONTH
+    ):
+        return f"{year}-{int(month_num):02d}"
+    raise ValueError(f"Invalid month format '{month}', expected YYYY-MM")
+
 
 class HistoryError(Exception):
     """Base exception for history-related errors."""
@@ -40,6 +77,8 @@ class HistoryManager:
         manager.save()
     """
 
+    __slots__ = ("_history", "_loaded", "history_path")
+
     def __init__(self, history_path: Path | str | None = None) -> None:
         """Initialize history manager.
 
@@ -71,14 +110,16 @@ class HistoryManager:
         Raises:
             HistoryError: If history file cannot be parsed
         """
-        if not self.history_path.exists():
-            self._history = {}
-            self._loaded = True
-            return
-
         try:
-            with self.history_path.open(encoding="utf-8") as f:
-                data = json.load(f)
+            # Open directly instead of checking exists() first: one syscall
+            # fewer, and no race between the check and the read
+            try:
+                raw = self.history_path.read_bytes()
+            except (FileNotFoundError, NotADirectoryError):
+                self._history = {}
+                self._loaded = True
+                return
+            data = json.loads(raw)
 
             # Parse each month's entry using Pydantic
             self._history = {}
@@ -126,6 +167,8 @@ class HistoryManager:
 
         Creates parent directory if it doesn't exist.
         Sets file permissions to 600 (owner read/write only).
+        The file is replaced atomically, so a failed save keeps the
+        previous history intact.
 
         Raises:
             HistoryError: If save operation fails
@@ -146,13 +189,20 @@ class HistoryManager:
                     entry_dict["regenerated_at"] = entry.regenerated_at.isoformat()
                 data[month] = entry_dict
 
-            # Write to file with pretty formatting
-            with self.history_path.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-                f.write("\n")  # Add trailing newline
-
-            # Set secure permissions
-            self.history_path.chmod(0o600)
+            # Pretty formatting with a trailing newline
+            content = json.dumps(data, indent=2) + "\n"
+
+            # Write a sibling temp file and rename it over the history file,
+            # so an interrupted save never leaves a truncated history behind
+            tmp_path = self.history_path.with_name(f"{self.history_path.name}.tmp")
+            try:
+                tmp_path.write_text(content, encoding="utf-8")
+                # Set secure permissions before the file becomes visible
+                tmp_path.chmod(0o600)
+                tmp_path.replace(self.history_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
 
         except Exception as e:
             raise HistoryError(f"Failed to save history: {e}") from e
@@ -184,14 +234,7 @@ class HistoryManager:
         """
         self._ensure_loaded()
 
-        # Validate month format
-        try:
-            parsed_month = datetime.strptime(month, "%Y-%m")
-        except ValueError as e:
-            raise ValueError(f"Invalid month format '{month}', expected YYYY-MM") from e
-
-        # Normalize to YYYY-MM format
-        month_key = parsed_month.strftime("%Y-%m")
+        month_key = _normalize_month(month)
 
         # Delete if exists
         if month_key in self._history:
@@ -205,17 +248,22 @@ class HistoryManager:
         if not self._loaded:
             self.load()
 
-    def get_all_entries(self) -> dict[str, HistoryEntry]:
+    def get_all_entries(self) -> Mapping[str, HistoryEntry]:
         """Get all history entries.
 
         Returns:
-            Dictionary mapping month (YYYY-MM) to HistoryEntry
+            Read-only view mapping month (YYYY-MM) to HistoryEntry
         """
         self._ensure_loaded()
-        return self._history.copy()
+        return MappingProxyType(self._history)
 
     def add_entry(
-        self, month: str, first_change_date: date, last_change_date: date
+        self,
+        month: str,
+        first_change_date: date,
+        last_change_date: date,
+        *,
+        now: datetime | None = None,
     ) -> None:
         """Add a history entry for a completed report.
 
@@ -223,21 +271,18 @@ class HistoryManager:
             month: Month in YYYY-MM format
             first_change_date: Start date of the Did range
             last_change_date: End date of the Did range (cutoff date)
+            now: Timestamp to record as generation/regeneration time.
+                Defaults to the current time; batch callers can pass a
+                single precomputed value.
 
         Raises:
             ValueError: If month format is invalid
         """
         self._ensure_loaded()
 
-        # Validate and normalize month format
-        try:
-            parsed_month = datetime.strptime(month, "%Y-%m")
-        except ValueError as e:
-            raise ValueError(f"Invalid month format '{month}', expected YYYY-MM") from e
-
-        # Normalize to YYYY-MM format
-        month_key = parsed_month.strftime("%Y-%m")
-        now = datetime.now()
+        month_key = _normalize_month(month)
+        if now is None:
+            now = datetime.now()
 
         # Check if this is a regeneration
         if month_key in self._history:
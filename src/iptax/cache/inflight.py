@@ -230,26 +230,47 @@ class InFlightCache:
         if not cache_path.exists():
             return None
 
+        raw = cache_path.read_bytes()
         try:
-            with cache_path.open("r") as f:
-                data = json.load(f)
+            # pydantic-core parses and validates the JSON in a single pass,
+            # without building an intermediate dict of Python objects
+            report = InFlightReport.model_validate_json(raw)
+        except ValidationError as e:
+            # Older schemas usually fail validation as well, so tell them
+            # apart from corrupted files to keep the warning accurate
+            try:
+                data = json.loads(raw)
+            except ValueError:
+                data = None
+            if (
+                isinstance(data, dict)
+                and data.get("schema_version") != INFLIGHT_SCHEMA_VERSION
+            ):
+                self._warn_incompatible_schema(cache_path, data.get("schema_version"))
+            else:
+                logger.warning("Corrupted cache file %s: %s", cache_path, e)
+            return None
 
-            # Check schema version compatibility
-            schema_version = data.get("schema_version")
-            if schema_version != INFLIGHT_SCHEMA_VERSION:
-                logger.warning(
-                    "Incompatible cache schema version in %s: "
-                    "expected %s, got %s. Cache will be ignored.",
-                    cache_path,
-                    INFLIGHT_SCHEMA_VERSION,
-                    schema_version,
-                )
-                return None
-
-            return InFlightReport(**data)
-        except (json.JSONDecodeError, ValidationError) as e:
-            logger.warning("Corrupted cache file %s: %s", cache_path, e)
+        if report.schema_version != INFLIGHT_SCHEMA_VERSION:
+            self._warn_incompatible_schema(cache_path, report.schema_version)
             return None
+        return report
+
+    @staticmethod
+    def _warn_incompatible_schema(cache_path: Path, schema_version: object) -> None:
+        """Log that a cache file was written with another schema version.
+
+        Args:
+            cache_path: Path to the ignored cache file
+            schema_version: Schema version found in the file
+        """
+        logger.warning(
+            "Incompatible cache schema version in %s: "
+            "expected %s, got %s. Cache will be ignored.",
+            cache_path,
+            INFLIGHT_SCHEMA_VERSION,
+            schema_version,
+        )
 
     def save(self, report: InFlightReport) -> Path:
         """Save in-flight report to cache.
@@ -1,6 +1,7 @@
 """Reusable CLI elements for displaying output."""
 
 import json
+from collections.abc import Mapping
 from datetime import date, timedelta
 from pathlib import Path
 
@@ -170,12 +171,14 @@ def display_review_results(
         console.print(f"  {action_icon} [green]✓[/] {title}{reason_str}")
 
 
-def display_history_table(console: Console, entries: dict[str, HistoryEntry]) -> None:
+def display_history_table(
+    console: Console, entries: Mapping[str, HistoryEntry]
+) -> None:
     """Display history entries as a formatted table.
 
     Args:
         console: Rich console for output
-        entries: Dictionary of month -> HistoryEntry
+        entries: Mapping of month -> HistoryEntry
     """
     table = Table(title="Report History", show_header=True, header_style="bold cyan")
     table.add_column("Month", style="cyan", no_wrap=True)
@@ -207,11 +210,11 @@ def display_history_table(console: Console, entries: dict[str, HistoryEntry]) ->
         )
 
 
-def format_history_json(entries: dict[str, HistoryEntry]) -> str:
+def format_history_json(entries: Mapping[str, HistoryEntry]) -> str:
     """Format history entries as JSON.
 
     Args:
-        entries: Dictionary of month -> HistoryEntry
+        entries: Mapping of month -> HistoryEntry
 
     Returns:
         JSON string
@@ -220,11 +223,11 @@ def format_history_json(entries: dict[str, HistoryEntry]) -> str:
     return json.dumps(data, indent=2)
 
 
-def format_history_yaml(entries: dict[str, HistoryEntry]) -> str:
+def format_history_yaml(entries: Mapping[str, HistoryEntry]) -> str:
     """Format history entries as YAML.
 
     Args:
-        entries: Dictionary of month -> HistoryEntry
+        entries: Mapping of month -> HistoryEntry
 
     Returns:
         YAML string
@@ -233,7 +236,7 @@ def format_history_yaml(entries: dict[str, HistoryEntry]) -> str:
     return yaml.safe_dump(data, default_flow_style=False, sort_keys=False)
 
 
-def _convert_entries_to_dict(entries: dict[str, HistoryEntry]) -> dict:
+def _convert_entries_to_dict(entries: Mapping[str, HistoryEntry]) -> dict:
     """Convert history entries to serializable dictionary."""
     data = {}
     for month, entry in entries.items():
@@ -496,7 +499,7 @@ def _get_next_month(month: str) -> str:
 
 
 def _find_continuous_periods(
-    entries: dict[str, HistoryEntry],
+    entries: Mapping[str, HistoryEntry],
 ) -> list[tuple[str, str, int, bool]]:
     """Find continuous monthly periods in history.
 
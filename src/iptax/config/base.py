@@ -5,8 +5,7 @@ for the iptax application. It manages both the iptax settings and integration
 with the did configuration.
 """
 
-import contextlib
-import os
+import stat
 from pathlib import Path
 from typing import NoReturn
 
@@ -16,8 +15,8 @@ from did.base import Config as DidSdkConfig
 
 from iptax.config.interactive import run_interactive_wizard
 from iptax.models import (
+    DISABLED_AI_CONFIG,
     DidConfig,
-    DisabledAIConfig,
     EmployeeInfo,
     ProductConfig,
     ReportConfig,
@@ -32,6 +31,20 @@ from iptax.utils.env import (
 )
 
 
+def _as_path(value: Path | str | None) -> Path | None:
+    """Convert an optional path argument to Path, reusing Path instances.
+
+    Args:
+        value: Path, string path, or None/empty string for "not given"
+
+    Returns:
+        Path, or None if no path was given
+    """
+    if isinstance(value, Path):
+        return value
+    return Path(value) if value else None
+
+
 class ConfigError(Exception):
     """Configuration-related error."""
 
@@ -78,13 +91,15 @@ class Configurator:
                 location (~/.did/config)
         """
         self.settings_path = (
-            Path(settings_path) if settings_path else self._get_default_settings_path()
+            _as_path(settings_path) or self._get_default_settings_path()
         )
         self.did_config_path = (
-            Path(did_config_path)
-            if did_config_path
-            else self._get_default_did_config_path()
+            _as_path(did_config_path) or self._get_default_did_config_path()
         )
+        # Did config path already validated by create(), if any
+        self._validated_did_path: Path | None = None
+        # Parsed providers keyed by (path, mtime_ns) of the did config
+        self._providers_cache: tuple[tuple[Path, int], list[str]] | None = None
 
     @staticmethod
     def _get_default_settings_path() -> Path:
@@ -117,12 +132,6 @@ class Configurator:
         Raises:
             ConfigError: If config file doesn't exist or is invalid
         """
-        if not self.settings_path.exists():
-            raise ConfigError(
-                f"Configuration file not found: {self.settings_path}\n\n"
-                "Please run 'iptax config' to set up your configuration."
-            )
-
         try:
             return Settings.from_yaml_file(self.settings_path)
         except FileNotFoundError as e:
@@ -154,24 +163,42 @@ class Configurator:
         Raises:
             DidConfigError: If did config doesn't exist or is not readable
         """
-        if not self.did_config_path.exists():
+        self._check_did_config_readable()
+        return True
+
+    def _check_did_config_readable(self) -> None:
+        """Check that the did config file can be opened for reading.
+
+        A single stat and open stand in for separate exists/is_file/access
+        checks, with each failure mapped to its user-facing error. Only
+        regular files are opened, since opening a FIFO would block. The
+        contents are not read; the did SDK loads the file by path.
+
+        Raises:
+            DidConfigError: If did config doesn't exist or is not readable
+        """
+        try:
+            st = self.did_config_path.stat()
+            if not stat.S_ISREG(st.st_mode):
+                raise DidConfigError(f"{self.did_config_path} exists but is not a file")
+            with self.did_config_path.open("rb"):
+                pass
+        except (FileNotFoundError, NotADirectoryError) as e:
             raise DidConfigError(
                 f"did config file not found at {self.did_config_path}\n\n"
                 "Please configure did first:\n"
                 "  https://github.com/psss/did#setup\n\n"
                 "Then run 'iptax config' to configure iptax."
-            )
-
-        if not self.did_config_path.is_file():
-            raise DidConfigError(f"{self.did_config_path} exists but is not a file")
-
-        if not os.access(self.did_config_path, os.R_OK):
+            ) from e
+        except PermissionError as e:
             raise DidConfigError(
                 f"{self.did_config_path} is not readable. "
                 "Please check file permissions."
-            )
-
-        return True
+            ) from e
+        except OSError as e:
+            raise DidConfigError(
+                f"Cannot read did config file {self.did_config_path}: {e}"
+            ) from e
 
     def _raise_no_providers_error(self) -> NoReturn:
         """Raise error when no providers are configured.
@@ -201,8 +228,43 @@ class Configurator:
         Raises:
             DidConfigError: If did config is invalid or cannot be parsed
         """
-        # First validate that the config exists
-        self.validate_did_config()
+        return self._list_did_providers_raw()
+
+    def _list_did_providers_raw(self, already_validated: bool = False) -> list[str]:
+        """List providers from did config, reusing earlier work when possible.
+
+        The parsed provider list is cached per ``(path, mtime_ns)``, so the
+        wizard callback chain doesn't re-read an unchanged did config.
+
+        Args:
+            already_validated: Skip validate_did_config() when the caller
+                has just validated the same path.
+
+        Returns:
+            List of provider names
+
+        Raises:
+            DidConfigError: If did config is invalid or cannot be parsed
+        """
+        # Validate even on a cache hit: permission changes leave mtime alone
+        if not already_validated:
+            self.validate_did_config()
+
+        # An unchanged did config reuses the earlier listing without parsing
+        # the file contents again
+        try:
+            cache_key = (
+                self.did_config_path,
+                self.did_config_path.stat().st_mtime_ns,
+            )
+        except OSError:
+            cache_key = None
+        if (
+            cache_key is not None
+            and self._providers_cache
+            and self._providers_cache[0] == cache_key
+        ):
+            return list(self._providers_cache[1])
 
         try:
             # Load did config using the SDK (pass path as keyword argument)
@@ -217,7 +279,9 @@ class Configurator:
             ]
 
             if providers:
-                return providers
+                if cache_key is not None:
+                    self._providers_cache = (cache_key, providers)
+                return list(providers)
 
             # No providers configured
             self._raise_no_providers_error()
@@ -247,15 +311,17 @@ class Configurator:
         """
         # First validate that did is configured
         self.validate_did_config()
+        self._validated_did_path = self.did_config_path
 
         # Create config directory if it doesn't exist
         self.settings_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Try to load existing settings for defaults
-        current_settings = None
-        if self.settings_path.exists():
-            with contextlib.suppress(ConfigError):
-                current_settings = self.load()
+        current_settings: Settings | None
+        try:
+            current_settings = self.load()
+        except ConfigError:
+            current_settings = None
 
         if interactive:
             settings = self._interactive_config_wizard(defaults=current_settings)
@@ -285,7 +351,9 @@ class Configurator:
         original_path = self.did_config_path
         try:
             self.did_config_path = path
-            return self.list_did_providers()
+            return self._list_did_providers_raw(
+                already_validated=path == self._validated_did_path
+            )
         finally:
             self.did_config_path = original_path
 
@@ -314,7 +382,9 @@ class Configurator:
         """
         # Get available providers from did config
         try:
-            available_providers = self.list_did_providers()
+            available_providers = self._list_did_providers_raw(
+                already_validated=self.did_config_path == self._validated_did_path
+            )
         except DidConfigError:
             available_providers = ["github.com"]
 
@@ -327,7 +397,7 @@ class Configurator:
                 name="Your Product Name",
             ),
             report=ReportConfig(),  # Uses defaults from model
-            ai=DisabledAIConfig(),
+            ai=DISABLED_AI_CONFIG,
             workday=WorkdayConfig(enabled=False),
             did=DidConfig(
                 config_path=str(self.did_config_path),
@@ -4,15 +4,20 @@ This module handles the interactive questionnaire-based configuration setup,
 separated from the core configuration management logic.
 """
 
-from collections.abc import Callable
+import functools
+from collections.abc import Callable, Iterable
+from itertools import chain, repeat
 from pathlib import Path
+from typing import Any
 
 import questionary
+from pydantic import BaseModel
 from questionary.prompts.common import Choice
 
 # All prompts use unsafe_ask() to propagate KeyboardInterrupt
 # instead of returning None, allowing clean exit on Ctrl+C
 from iptax.models import (
+    DISABLED_AI_CONFIG,
     MAX_PERCENTAGE,
     AIProviderConfig,
     AIProviderConfigBase,
@@ -29,6 +34,50 @@ from iptax.models import (
 )
 
 
+@functools.cache
+def _field_default(model: type[BaseModel], name: str) -> Any:  # noqa: ANN401
+    """Get a model field's default value, memoized per (model, field).
+
+    Args:
+        model: Pydantic model class
+        name: Field name
+
+    Returns:
+        The field's default value
+    """
+    return getattr(Fields(model), name).default
+
+
+_PERCENT_ERROR = f"Must be 0-{MAX_PERCENTAGE}"
+
+
+def _validate_percent(value: str) -> bool | str:
+    """Validate a whole-number answer in the 0-MAX_PERCENTAGE range.
+
+    Only plain digits are accepted; int() alone would also allow signs,
+    surrounding whitespace and underscores.
+    """
+    if not value.isdecimal():
+        return _PERCENT_ERROR
+    return 0 <= int(value) <= MAX_PERCENTAGE or _PERCENT_ERROR
+
+
+def _not_empty(message: str) -> Callable[[str], bool | str]:
+    """Build a validator rejecting blank answers with the given message."""
+
+    def validate(value: str) -> bool | str:
+        return bool(value.strip()) or message
+
+    return validate
+
+
+_validate_name = _not_empty("Name cannot be empty")
+_validate_product_name = _not_empty("Product name cannot be empty")
+_validate_path = _not_empty("Path cannot be empty")
+_validate_project_id = _not_empty("Project ID cannot be empty")
+_validate_url = _not_empty("URL cannot be empty")
+
+
 def run_interactive_wizard(
     defaults: Settings | None,
     list_providers_fn: Callable[[Path], list[str]],
@@ -42,8 +91,7 @@ def run_interactive_wizard(
     Returns:
         Configured Settings instance
     """
-    questionary.print("Welcome to iptax configuration!", style="bold")
-    questionary.print("")
+    questionary.print("Welcome to iptax configuration!\n", style="bold")
 
     employee = _get_employee_info(defaults)
     product = _get_product_config(defaults)
@@ -66,20 +114,20 @@ def _get_employee_info(defaults: Settings | None) -> EmployeeInfo:
     """Get employee information interactively."""
     questionary.print("Employee Information:", style="bold")
 
-    default_name = defaults.employee.name if defaults and defaults.employee else ""
+    employee = defaults.employee if defaults else None
+
+    default_name = employee.name if employee else ""
     employee_name = questionary.text(
         "Employee name:",
         default=default_name,
-        validate=lambda x: len(x.strip()) > 0 or "Name cannot be empty",
+        validate=_validate_name,
     ).unsafe_ask()
 
-    default_supervisor = (
-        defaults.employee.supervisor if defaults and defaults.employee else ""
-    )
+    default_supervisor = employee.supervisor if employee else ""
     supervisor_name = questionary.text(
         "Supervisor name:",
         default=default_supervisor,
-        validate=lambda x: len(x.strip()) > 0 or "Name cannot be empty",
+        validate=_validate_name,
     ).unsafe_ask()
 
     return EmployeeInfo(name=employee_name, supervisor=supervisor_name)
@@ -93,7 +141,7 @@ def _get_product_config(defaults: Settings | None) -> ProductConfig:
     product_name = questionary.text(
         "Product name:",
         default=default_product,
-        validate=lambda x: len(x.strip()) > 0 or "Product name cannot be empty",
+        validate=_validate_product_name,
     ).unsafe_ask()
 
     return ProductConfig(name=product_name)
@@ -103,24 +151,23 @@ def _get_report_config(defaults: Settings | None) -> ReportConfig:
     """Get report configuration interactively."""
     questionary.print("\nReport Settings:", style="bold")
 
+    report = defaults.report if defaults else None
+
     # Get defaults from model or existing config
     default_percentage = (
-        defaults.report.creative_work_percentage
-        if defaults
-        else Fields(ReportConfig).creative_work_percentage.default
+        report.creative_work_percentage
+        if report
+        else _field_default(ReportConfig, "creative_work_percentage")
     )
 
     creative_percentage = questionary.text(
         f"Creative work percentage (0-{MAX_PERCENTAGE}) [{default_percentage}]:",
         default=str(default_percentage),
-        validate=lambda x: (x.isdigit() and 0 <= int(x) <= MAX_PERCENTAGE)
-        or f"Must be 0-{MAX_PERCENTAGE}",
+        validate=_validate_percent,
     ).unsafe_ask()
 
     default_output_dir = (
-        str(defaults.report.output_dir)
-        if defaults
-        else Fields(ReportConfig).output_dir.default
+        str(report.output_dir) if report else _field_default(ReportConfig, "output_dir")
     )
 
     output_dir = questionary.text(
@@ -137,17 +184,23 @@ def _get_ai_config(defaults: Settings | None) -> AIProviderConfig:
     """Get AI configuration interactively."""
     questionary.print("\nAI Provider Configuration:", style="bold")
 
-    default_enable_ai = (
-        not isinstance(defaults.ai, DisabledAIConfig) if defaults else True
-    )
+    default_ai_config = defaults.ai if defaults else None
+
+    default_enable_ai = not isinstance(default_ai_config, DisabledAIConfig)
     enable_ai = questionary.confirm(
         "Enable AI filtering?", default=default_enable_ai
     ).unsafe_ask()
 
     if enable_ai:
-        default_ai_config = defaults.ai if defaults else None
         return _configure_ai_provider(default_ai_config)
-    return DisabledAIConfig()
+    return DISABLED_AI_CONFIG
+
+
+# Provider choice preselected for an existing AI config of each type
+_PROVIDER_CHOICES: dict[type, str] = {
+    GeminiProviderConfig: "gemini",
+    VertexAIProviderConfig: "vertex",
+}
 
 
 def _configure_ai_provider(
@@ -161,11 +214,7 @@ def _configure_ai_provider(
     Returns:
         Configured AI provider (Gemini or Vertex AI)
     """
-    default_provider = "gemini"
-    if isinstance(default_config, GeminiProviderConfig):
-        default_provider = "gemini"
-    elif isinstance(default_config, VertexAIProviderConfig):
-        default_provider = "vertex"
+    default_provider = _PROVIDER_CHOICES.get(type(default_config), "gemini")
 
     provider = questionary.select(
         "Select AI provider:",
@@ -184,26 +233,21 @@ def _configure_ai_provider(
     questionary.print(
         f"Unknown provider '{provider}', using disabled AI", style="yellow"
     )
-    return DisabledAIConfig()
+    return DISABLED_AI_CONFIG
 
 
 def _get_hints_list(default_config: AIProviderConfig | None) -> list[str]:
     """Get hints one at a time until empty input."""
-    default_hints: list[str] = []
+    default_hints: Iterable[str] = ()
     if isinstance(default_config, AIProviderConfigBase):
-        default_hints = list(default_config.hints)
+        default_hints = default_config.hints
 
     hints: list[str] = []
 
     questionary.print("Enter AI evaluation hints (empty to finish):", style="italic")
 
-    hint_num = 1
-    while True:
-        # Pre-fill from defaults if available
-        default_value = (
-            default_hints[hint_num - 1] if hint_num <= len(default_hints) else ""
-        )
-
+    # Pre-fill from defaults while available, then offer empty prompts
+    for hint_num, default_value in enumerate(chain(default_hints, repeat("")), start=1):
         hint = questionary.text(
             f"  Hint {hint_num}:",
             default=default_value,
@@ -213,7 +257,6 @@ def _get_hints_list(default_config: AIProviderConfig | None) -> list[str]:
             break
 
         hints.append(hint.strip())
-        hint_num += 1
 
     if hints:
         questionary.print(f"  ✓ {len(hints)} hint(s) configured", style="green")
@@ -233,17 +276,21 @@ def _get_ai_advanced_options(
         Tuple of (hints, max_learnings, correction_ratio)
     """
     # Get default values from model
-    default_max_learnings = Fields(AIProviderConfigBase).max_learnings.default
-    default_correction_ratio = Fields(AIProviderConfigBase).correction_ratio.default
+    default_max_learnings = _field_default(AIProviderConfigBase, "max_learnings")
+    default_correction_ratio = _field_default(AIProviderConfigBase, "correction_ratio")
 
     questionary.print("\nAdvanced AI Options:", style="bold")
 
+    current = (
+        default_config if isinstance(default_config, AIProviderConfigBase) else None
+    )
+
     # Default to True if any advanced options are already configured
     has_advanced_options = False
-    if isinstance(default_config, AIProviderConfigBase):
-        has_hints = bool(default_config.hints)
-        has_custom_learnings = default_config.max_learnings != default_max_learnings
-        has_custom_ratio = default_config.correction_ratio != default_correction_ratio
+    if current:
+        has_hints = bool(current.hints)
+        has_custom_learnings = current.max_learnings != default_max_learnings
+        has_custom_ratio = current.correction_ratio != default_correction_ratio
         has_advanced_options = has_hints or has_custom_learnings or has_custom_ratio
 
     configure_advanced = questionary.confirm(
@@ -253,11 +300,11 @@ def _get_ai_advanced_options(
 
     if not configure_advanced:
         # Return current values or defaults
-        if isinstance(default_config, AIProviderConfigBase):
+        if current:
             return (
-                default_config.hints,
-                default_config.max_learnings,
-                default_config.correction_ratio,
+                current.hints,
+                current.max_learnings,
+                current.correction_ratio,
             )
         return ([], default_max_learnings, default_correction_ratio)
 
@@ -265,31 +312,21 @@ def _get_ai_advanced_options(
     hints = _get_hints_list(default_config)
 
     # Max learnings
-    current_max = (
-        default_config.max_learnings
-        if isinstance(default_config, AIProviderConfigBase)
-        else default_max_learnings
-    )
+    current_max = current.max_learnings if current else default_max_learnings
     max_learnings_input = questionary.text(
         f"Max learning entries for AI context (0-{MAX_PERCENTAGE}) [{current_max}]:",
         default=str(current_max),
-        validate=lambda x: (x.isdigit() and 0 <= int(x) <= MAX_PERCENTAGE)
-        or f"Must be 0-{MAX_PERCENTAGE}",
+        validate=_validate_percent,
     ).unsafe_ask()
     max_learnings = int(max_learnings_input)
 
     # Correction ratio (as percentage for user-friendliness)
-    current_ratio = (
-        default_config.correction_ratio
-        if isinstance(default_config, AIProviderConfigBase)
-        else default_correction_ratio
-    )
+    current_ratio = current.correction_ratio if current else default_correction_ratio
     current_percent = int(current_ratio * MAX_PERCENTAGE)
     ratio_input = questionary.text(
         f"Correction ratio % (0-{MAX_PERCENTAGE}) [{current_percent}]:",
         default=str(current_percent),
-        validate=lambda x: (x.isdigit() and 0 <= int(x) <= MAX_PERCENTAGE)
-        or f"Must be 0-{MAX_PERCENTAGE}",
+        validate=_validate_percent,
     ).unsafe_ask()
     correction_ratio = int(ratio_input) / float(MAX_PERCENTAGE)
 
@@ -298,15 +335,17 @@ def _get_ai_advanced_options(
 
 def _configure_gemini(default_config: AIProviderConfig | None) -> GeminiProviderConfig:
     """Configure Gemini API provider."""
+    current = (
+        default_config if isinstance(default_config, GeminiProviderConfig) else None
+    )
+
     default_model = (
-        default_config.model
-        if isinstance(default_config, GeminiProviderConfig)
-        else Fields(GeminiProviderConfig).model.default
+        current.model if current else _field_default(GeminiProviderConfig, "model")
     )
     default_api_key_env = (
-        default_config.api_key_env
-        if isinstance(default_config, GeminiProviderConfig)
-        else Fields(GeminiProviderConfig).api_key_env.default
+        current.api_key_env
+        if current
+        else _field_default(GeminiProviderConfig, "api_key_env")
     )
 
     model = questionary.text(
@@ -318,11 +357,7 @@ def _configure_gemini(default_config: AIProviderConfig | None) -> GeminiProvider
         default=default_api_key_env,
     ).unsafe_ask()
 
-    default_use_env_file = (
-        bool(default_config.api_key_file)
-        if isinstance(default_config, GeminiProviderConfig)
-        else False
-    )
+    default_use_env_file = bool(current.api_key_file) if current else False
 
     use_env_file = questionary.confirm(
         "Use .env file for API key? (default: use system environment)",
@@ -332,15 +367,12 @@ def _configure_gemini(default_config: AIProviderConfig | None) -> GeminiProvider
     api_key_file = None
     if use_env_file:
         default_path = (
-            str(default_config.api_key_file)
-            if isinstance(default_config, GeminiProviderConfig)
-            and default_config.api_key_file
-            else ""
+            str(current.api_key_file) if current and current.api_key_file else ""
         )
         api_key_file = questionary.text(
             "Path to .env file:",
             default=default_path,
-            validate=lambda x: len(x.strip()) > 0 or "Path cannot be empty",
+            validate=_validate_path,
         ).unsafe_ask()
 
     # Get advanced options
@@ -360,21 +392,19 @@ def _configure_vertex(
     default_config: AIProviderConfig | None,
 ) -> VertexAIProviderConfig:
     """Configure Vertex AI provider."""
+    current = (
+        default_config if isinstance(default_config, VertexAIProviderConfig) else None
+    )
+
     default_model = (
-        default_config.model
-        if isinstance(default_config, VertexAIProviderConfig)
-        else Fields(VertexAIProviderConfig).model.default
+        current.model if current else _field_default(VertexAIProviderConfig, "model")
     )
     default_location = (
-        default_config.location
-        if isinstance(default_config, VertexAIProviderConfig)
-        else Fields(VertexAIProviderConfig).location.default
-    )
-    default_project_id = (
-        default_config.project_id
-        if isinstance(default_config, VertexAIProviderConfig)
-        else ""
+        current.location
+        if current
+        else _field_default(VertexAIProviderConfig, "location")
     )
+    default_project_id = current.project_id if current else ""
 
     model = questionary.text(
         f"Model [{default_model}]:", default=default_model
@@ -383,7 +413,7 @@ def _configure_vertex(
     project_id = questionary.text(
         "GCP Project ID:",
         default=default_project_id,
-        validate=lambda x: len(x.strip()) > 0 or "Project ID cannot be empty",
+        validate=_validate_project_id,
     ).unsafe_ask()
 
     location = questionary.text(
@@ -391,10 +421,7 @@ def _configure_vertex(
     ).unsafe_ask()
 
     default_credentials = (
-        str(default_config.credentials_file)
-        if isinstance(default_config, VertexAIProviderConfig)
-        and default_config.credentials_file
-        else ""
+        str(current.credentials_file) if current and current.credentials_file else ""
     )
 
     credentials_file = questionary.text(
@@ -420,20 +447,22 @@ def _get_workday_config(defaults: Settings | None) -> WorkdayConfig:
     """Get Workday configuration interactively."""
     questionary.print("\nWorkday Integration:", style="bold")
 
-    default_enable_workday = defaults.workday.enabled if defaults else True
+    workday = defaults.workday if defaults else None
+
+    default_enable_workday = workday.enabled if workday else True
     enable_workday = questionary.confirm(
         "Enable Workday integration?", default=default_enable_workday
     ).unsafe_ask()
 
     if enable_workday:
-        default_url = defaults.workday.url if defaults and defaults.workday.url else ""
+        default_url = workday.url if workday and workday.url else ""
         workday_url = questionary.text(
             "Workday URL (e.g., https://workday.example.org):",
             default=default_url,
-            validate=lambda x: len(x.strip()) > 0 or "URL cannot be empty",
+            validate=_validate_url,
         ).unsafe_ask()
 
-        default_auth = defaults.workday.auth if defaults else "sso+kerberos"
+        default_auth = workday.auth if workday else "sso+kerberos"
         auth_method = questionary.select(
             "Authentication method:",
             choices=[
@@ -451,11 +480,7 @@ def _get_workday_config(defaults: Settings | None) -> WorkdayConfig:
 
         trusted_uris: list[str] = []
         if auth_method == "sso+kerberos":
-            default_uris = (
-                ",".join(defaults.workday.trusted_uris)
-                if defaults and defaults.workday.trusted_uris
-                else ""
-            )
+            default_uris = ",".join(workday.trusted_uris) if workday else ""
             uris_input = questionary.text(
                 "Trusted URIs for Kerberos/SPNEGO (comma-separated, "
                 "e.g., *.example.org,*.sso.example.org):",
@@ -484,7 +509,7 @@ def _get_did_config(
     default_did_path = (
         str(defaults.did.config_path)
         if defaults
-        else Fields(DidConfig).config_path.default
+        else _field_default(DidConfig, "config_path")
     )
 
     did_path = questionary.text(
@@ -517,10 +542,18 @@ def _get_did_config(
         selected_providers = available_providers
 
     questionary.print("\nSelected providers:", style="bold")
-    for provider in selected_providers:
-        questionary.print(f"  ✓ {provider}", style="green")
+    # One styled write for the whole list rather than one per provider
+    questionary.print(
+        "\n".join(f"  ✓ {provider}" for provider in selected_providers),
+        style="green",
+    )
 
     return DidConfig(
         config_path=did_path,
         providers=selected_providers,
+        max_parallel_providers=(
+            defaults.did.max_parallel_providers
+            if defaults
+            else _field_default(DidConfig, "max_parallel_providers")
+        ),
     )
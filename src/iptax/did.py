@@ -4,12 +4,20 @@ This module provides integration with the did SDK to fetch merged pull requests
 and merge requests from GitHub and GitLab for IP tax reporting purposes.
 """
 
+import functools
 import io
 import logging
+import operator
+import queue
 import re
-from contextlib import redirect_stderr, redirect_stdout
+import sys
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
 from datetime import date, datetime
-from typing import Literal, cast
+from pathlib import Path
+from typing import Any, Literal, TextIO
 from urllib.parse import urlparse
 
 import did.base
@@ -21,8 +29,26 @@ from iptax.models import Change, Repository, Settings
 
 logger = logging.getLogger(__name__)
 
-# Constants for stat detection
-MERGED_STAT_KEYWORDS = ("merged", "pull", "merge")
+# Constants for stat detection: a merged stat class name contains "merged"
+# and either "pull" (GitHub) or "merge" (GitLab)
+MERGED_KEYWORD = "merged"
+PULL_KEYWORD = "pull"
+MERGE_KEYWORD = "merge"
+MERGED_STAT_KEYWORDS = (MERGED_KEYWORD, PULL_KEYWORD, MERGE_KEYWORD)
+
+# GitHub emoji codes (e.g., :rocket:, :bug:, :sparkles:, :100:, :+1:)
+# Matches word characters, digits, plus signs, and hyphens
+_EMOJI_RE = re.compile(r":[\w+-]+:", re.IGNORECASE)
+
+# Keywords in did's stderr output that indicate a failed run
+_STDERR_ERROR_RE = re.compile(r"error|fail|exception", re.IGNORECASE)
+
+# Sentinel for attributes missing on did objects (single lookup vs hasattr)
+_MISSING = object()
+
+# Attributes read from every GitHub PR / GitLab MR stat in a single C-level call
+_GITHUB_PR_FIELDS = operator.attrgetter("owner", "project", "id", "title")
+_GITLAB_MR_FIELDS = operator.attrgetter("project", "data")
 
 
 class DidIntegrationError(Exception):
@@ -33,6 +59,141 @@ class InvalidStatDataError(Exception):
     """Data validation error when converting did stat to Change object."""
 
 
+# Text streams did output can be captured into
+_TextSink = TextIO | io.TextIOBase
+
+# Repository objects shared by all changes landed in the same repository,
+# keyed by (host, path, provider type); one mapping per fetch_changes() call
+_Repositories = dict[tuple[str, str, str], Repository]
+
+
+class _ThreadOutputRouter(io.TextIOBase):
+    """Text stream forwarding writes to the calling thread's capture buffer.
+
+    Threads without a registered buffer write to the original stream.
+    """
+
+    def __init__(self, fallback: TextIO) -> None:
+        super().__init__()
+        self.fallback = fallback
+        self._local = threading.local()
+
+    @property
+    def buffer_for_thread(self) -> _TextSink | None:
+        """Capture buffer registered by the current thread, if any."""
+        return getattr(self._local, "target", None)
+
+    @buffer_for_thread.setter
+    def buffer_for_thread(self, target: _TextSink | None) -> None:
+        self._local.target = target
+
+    def _target(self) -> _TextSink:
+        target = self.buffer_for_thread
+        return self.fallback if target is None else target
+
+    # Terminal and encoding details come from the original stream, so code
+    # probing sys.stdout (e.g. did's Coloring, Rich) sees the real console
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        return self.fallback.encoding
+
+    @property
+    def errors(self) -> str | None:  # type: ignore[override]
+        return self.fallback.errors
+
+    def isatty(self) -> bool:
+        return self.fallback.isatty()
+
+    def fileno(self) -> int:
+        return self.fallback.fileno()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        return self._target().write(s)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+
+class _OutputCapture:
+    """Per-thread stdout/stderr capture that is safe to use concurrently.
+
+    ``contextlib.redirect_stdout`` swaps the process-wide ``sys.stdout``, so
+    providers fetched concurrently would restore each other's streams in the
+    wrong order. Instead, routers are installed once for as long as any
+    capture is active and each thread registers its own buffers with them.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._depth = 0
+        self._routers: tuple[_ThreadOutputRouter, _ThreadOutputRouter] | None = None
+
+    @contextmanager
+    def capture(self, stdout: _TextSink, stderr: _TextSink) -> Iterator[None]:
+        """Capture stdout/stderr of the current thread into the given buffers.
+
+        Args:
+            stdout: Buffer receiving the current thread's stdout
+            stderr: Buffer receiving the current thread's stderr
+
+        Yields:
+            None
+        """
+        with self._lock:
+            if self._routers is None:
+                self._routers = (
+                    _ThreadOutputRouter(sys.stdout),
+                    _ThreadOutputRouter(sys.stderr),
+                )
+                sys.stdout, sys.stderr = self._routers
+            self._depth += 1
+            stdout_router, stderr_router = self._routers
+
+        stdout_router.buffer_for_thread = stdout
+        stderr_router.buffer_for_thread = stderr
+        try:
+            yield
+        finally:
+            stdout_router.buffer_for_thread = None
+            stderr_router.buffer_for_thread = None
+            with self._lock:
+                self._depth -= 1
+                if self._depth == 0:
+                    # Leave streams swapped by someone else in the meantime
+                    if sys.stdout is stdout_router:
+                        sys.stdout = stdout_router.fallback
+                    if sys.stderr is stderr_router:
+                        sys.stderr = stderr_router.fallback
+                    self._routers = None
+
+
+_output_capture = _OutputCapture()
+
+
+class _NullOutput(io.TextIOBase):
+    """Text sink discarding did output that is not going to be logged.
+
+    Unlike a file opened on ``os.devnull``, nothing is encoded or written.
+    """
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        return len(s)
+
+
+_null_output = _NullOutput()
+
+
+# did config files already loaded into did.base.Config:
+# path -> (st_mtime_ns, parser object installed by the load)
+_did_config_cache: dict[str, tuple[int, object]] = {}
+
+
 def fetch_changes(
     settings: Settings,
     start_date: date,
@@ -54,38 +215,136 @@ def fetch_changes(
     try:
         # Load did configuration
         config_path = str(settings.did.get_config_path())
-        did.base.Config(path=config_path)
+        _load_did_config(config_path)
     except Exception as e:
         raise DidIntegrationError(
             f"Failed to load did config from {config_path}: {e}"
         ) from e
 
-    # Fetch changes from all configured providers
+    # Fetch changes from all configured providers concurrently; results are
+    # collected in configuration order so the report stays deterministic
     all_changes: list[Change] = []
-
-    logger.info(f"Fetching changes from {len(settings.did.providers)} providers")
-    for provider_name in settings.did.providers:
-        try:
-            logger.info(
-                f"Fetching from provider '{provider_name}': "
-                f"{start_date} to {end_date}"
+    providers = settings.did.providers
+
+    logger.info(f"Fetching changes from {len(providers)} providers")
+    # Each worker runs did.cli.main() for one provider
+    workers = max(1, min(len(providers), settings.did.max_parallel_providers))
+    repositories: _Repositories = {}
+    calls: list[Callable[[], list[Change]]] = []
+    for provider_name in providers:
+        logger.info(
+            f"Fetching from provider '{provider_name}': {start_date} to {end_date}"
+        )
+        calls.append(
+            functools.partial(
+                _fetch_provider_changes,
+                provider_name,
+                start_date,
+                end_date,
+                repositories,
             )
-            changes = _fetch_provider_changes(provider_name, start_date, end_date)
+        )
+    futures = _start_daemon_workers(calls, workers)
+    try:
+        for provider_name, future in zip(providers, futures, strict=True):
+            try:
+                changes = future.result()
+            except Exception as e:
+                raise DidIntegrationError(
+                    f"Failed to fetch changes from provider '{provider_name}': {e}"
+                ) from e
             logger.info(f"Provider '{provider_name}' returned {len(changes)} changes")
             all_changes.extend(changes)
-        except Exception as e:
-            raise DidIntegrationError(
-                f"Failed to fetch changes from provider '{provider_name}': {e}"
-            ) from e
+    except BaseException:
+        # Providers not started yet are dropped; running ones are abandoned
+        for future in futures:
+            future.cancel()
+        raise
 
     logger.info(f"Total changes from all providers: {len(all_changes)}")
     return all_changes
 
 
+def _start_daemon_workers(
+    calls: list[Callable[[], list[Change]]], workers: int
+) -> list[Future[list[Change]]]:
+    """Run calls on daemon threads, at most ``workers`` of them at a time.
+
+    ThreadPoolExecutor joins its worker threads at interpreter exit, so a
+    did run still in flight after Ctrl+C or an error would keep the process
+    alive until it finished. Daemon threads are abandoned at exit instead.
+
+    Args:
+        calls: Calls to run, one per provider
+        workers: Maximum number of calls running concurrently
+
+    Returns:
+        Futures of the calls, in the order given; cancelling one that has
+        not started yet skips it
+    """
+    futures: list[Future[list[Change]]] = [Future() for _ in calls]
+    pending: queue.SimpleQueue[
+        tuple[Future[list[Change]], Callable[[], list[Change]]]
+    ] = queue.SimpleQueue()
+    for item in zip(futures, calls, strict=True):
+        pending.put(item)
+
+    def work() -> None:
+        while True:
+            try:
+                future, call = pending.get_nowait()
+            except queue.Empty:
+                return
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = call()
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    for index in range(min(workers, len(calls))):
+        threading.Thread(target=work, name=f"did-fetch-{index}", daemon=True).start()
+    return futures
+
+
+def _load_did_config(config_path: str) -> None:
+    """Load the did config file into did's global Config, unless already loaded.
+
+    did keeps the parsed config on the ``did.base.Config`` class, so the file
+    is only parsed again when it changed on disk since the last load or when
+    something else replaced the global config in the meantime.
+
+    Args:
+        config_path: Path to the did config file
+
+    Raises:
+        OSError: If the config file cannot be accessed
+    """
+    mtime_ns = Path(config_path).stat().st_mtime_ns
+    cached = _did_config_cache.get(config_path)
+    if (
+        cached is not None
+        and cached[0] == mtime_ns
+        and did.base.Config.parser is cached[1]
+    ):
+        return
+
+    did.base.Config(path=config_path)
+    _did_config_cache[config_path] = (mtime_ns, did.base.Config.parser)
+
+
+def _reset_did_config_cache() -> None:
+    """Forget loaded did configs so the next fetch parses the file again."""
+    _did_config_cache.clear()
+
+
 def _fetch_provider_changes(
     provider_name: str,
     start_date: date,
     end_date: date,
+    repositories: _Repositories | None = None,
 ) -> list[Change]:
     """Fetch changes from a specific provider using did.cli.main().
 
@@ -96,6 +355,7 @@ def _fetch_provider_changes(
         provider_name: Provider name from did config (e.g., "github.com", "gitlab.cee")
         start_date: Start of reporting period (inclusive)
         end_date: End of reporting period (inclusive)
+        repositories: Repository objects to share with other providers' changes
 
     Returns:
         List of Change objects from this provider
@@ -109,21 +369,24 @@ def _fetch_provider_changes(
         "pull-requests-merged" if provider_type == "github" else "merge-requests-merged"
     )
 
-    option = (
-        f"--{provider_name}-{option_suffix} "
-        f"--since {start_date.isoformat()} "
-        f"--until {end_date.isoformat()}"
-    )
+    argv = [
+        f"--{provider_name}-{option_suffix}",
+        "--since",
+        start_date.isoformat(),
+        "--until",
+        end_date.isoformat(),
+    ]
 
     try:
-        # Capture did's stdout and stderr (it prints the report and errors)
-        stdout_capture = io.StringIO()
+        # Capture did's stdout and stderr (it prints the report and errors);
+        # the printed report is only kept when it is going to be logged
+        stdout_capture = io.StringIO() if logger.isEnabledFor(logging.DEBUG) else None
         stderr_capture = io.StringIO()
 
-        # Redirect both stdout and stderr
-        with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
+        # Redirect both stdout and stderr of this thread
+        with _output_capture.capture(stdout_capture or _null_output, stderr_capture):
             # Call did.cli.main() to get stats (POPOs)
-            result = did.cli.main(option.split())
+            result = did.cli.main(argv)
 
         # Check for errors in stderr
         _check_did_stderr(
@@ -131,23 +394,24 @@ def _fetch_provider_changes(
         )
 
         # Log stdout output for debugging
-        stdout_content = stdout_capture.getvalue()
+        stdout_content = stdout_capture.getvalue() if stdout_capture else ""
         if stdout_content:
             logger.debug(
-                f"did CLI stdout for '{provider_name}': {stdout_content[:500]}"
+                "did CLI stdout for '%s': %s", provider_name, stdout_content[:500]
             )
 
         # Extract merged stats from result
-        logger.debug(f"did CLI result type: {type(result).__name__}")
-        if isinstance(result, tuple) and len(result) > 0:
-            logger.debug(f"did CLI result[0] type: {type(result[0]).__name__}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("did CLI result type: %s", type(result).__name__)
+            if isinstance(result, tuple) and len(result) > 0:
+                logger.debug("did CLI result[0] type: %s", type(result[0]).__name__)
         merged_stats = _extract_merged_stats(result, provider_name)
         logger.debug(
-            f"Extracted {len(merged_stats)} merged stats for '{provider_name}'"
+            "Extracted %d merged stats for '%s'", len(merged_stats), provider_name
         )
 
         # Convert did stats to Change objects
-        return _convert_stats_to_changes(merged_stats)
+        return _convert_stats_to_changes(merged_stats, repositories)
 
     except DidIntegrationError:
         # Re-raise our own exceptions
@@ -178,7 +442,7 @@ def _extract_merged_stats(result: object, provider_name: str) -> list[Issue]:
     # Validate and get stats list
     stats_list = _validate_stats_attribute(user_stats)
 
-    logger.debug(f"user_stats.stats has {len(stats_list)} provider groups")
+    logger.debug("user_stats.stats has %d provider groups", len(stats_list))
 
     # Empty user stats means no activity in the period - this is valid
     if len(stats_list) == 0:
@@ -188,7 +452,7 @@ def _extract_merged_stats(result: object, provider_name: str) -> list[Issue]:
     provider_stats_group = _find_provider_group(stats_list, provider_name)
 
     if provider_stats_group is None:
-        logger.debug(f"No matching provider group found for '{provider_name}'")
+        logger.debug("No matching provider group found for '%s'", provider_name)
         return []
 
     # Validate and get provider stats
@@ -213,12 +477,12 @@ def _validate_stats_attribute(obj: object) -> list[object]:
     Raises:
         DidIntegrationError: If stats attribute is missing or not a list
     """
-    if not hasattr(obj, "stats"):
+    stats = getattr(obj, "stats", _MISSING)
+    if stats is _MISSING:
         raise DidIntegrationError(
             f"Object (type: {type(obj).__name__}) missing 'stats' attribute"
         )
 
-    stats = obj.stats
     if not isinstance(stats, list):
         raise DidIntegrationError(f"stats is not a list (type: {type(stats).__name__})")
 
@@ -235,18 +499,21 @@ def _find_provider_group(stats_list: list[object], provider_name: str) -> object
     Returns:
         Matching provider group or None
     """
+    # The provider side of the match does not change between groups
     provider_lower = provider_name.lower()
+    wants_github = "github" in provider_lower
+    wants_gitlab = "gitlab" in provider_lower
+    if not (wants_github or wants_gitlab):
+        return None
 
     for group in stats_list:
-        group_name = type(group).__name__.lower()
-        logger.debug(
-            f"Checking provider group: {type(group).__name__} for provider match"
-        )
-
-        is_github_match = "github" in group_name and "github" in provider_lower
-        is_gitlab_match = "gitlab" in group_name and "gitlab" in provider_lower
+        group_type = type(group).__name__
+        logger.debug("Checking provider group: %s for provider match", group_type)
+        group_name = group_type.lower()
 
-        if is_github_match or is_gitlab_match:
+        if (wants_github and "github" in group_name) or (
+            wants_gitlab and "gitlab" in group_name
+        ):
             return group
 
     return None
@@ -264,14 +531,11 @@ def _validate_provider_stats(provider_stats_group: object) -> list[object]:
     Raises:
         DidIntegrationError: If validation fails
     """
-    logger.debug(
-        f"provider_stats_group type: {type(provider_stats_group).__name__}, "
-        f"has stats: {hasattr(provider_stats_group, 'stats')}"
-    )
+    logger.debug("provider_stats_group type: %s", type(provider_stats_group).__name__)
 
     stats = _validate_stats_attribute(provider_stats_group)
 
-    logger.debug(f"provider_stats_group.stats has {len(stats)} stat types")
+    logger.debug("provider_stats_group.stats has %d stat types", len(stats))
 
     return stats
 
@@ -288,28 +552,29 @@ def _find_merged_stats(provider_stats: list[object]) -> list[Issue]:
     Raises:
         DidIntegrationError: If merged stats not found or invalid
     """
-    for stat in provider_stats:
-        stat_class = stat.__class__.__name__
-        logger.debug(
-            f"Checking stat type: {stat_class}, "
-            f"is_merged: {_is_merged_stat(stat)}, "
-            f"has stats: {hasattr(stat, 'stats')}"
+    # did reports at most one merged stat per provider group - stop at it
+    merged_stat = next((stat for stat in provider_stats if _is_merged_stat(stat)), None)
+
+    if merged_stat is None:
+        # We requested merged stats in CLI but didn't find them - error
+        raise DidIntegrationError(
+            "Merged stats section not found in did result - "
+            "expected pull-requests-merged or merge-requests-merged"
         )
 
-        if not _is_merged_stat(stat):
-            continue
+    logger.debug("Found merged stat type: %s", merged_stat.__class__.__name__)
 
-        if not hasattr(stat, "stats"):
-            raise DidIntegrationError("Merged stat object missing 'stats' attribute")
+    stats = getattr(merged_stat, "stats", _MISSING)
+    if stats is _MISSING:
+        raise DidIntegrationError("Merged stat object missing 'stats' attribute")
 
-        # Cast to list[Issue] - did SDK uses Issue type for both PRs and MRs
-        return cast(list[Issue], stat.stats)
+    if not isinstance(stats, list):
+        raise DidIntegrationError(
+            f"Merged stats is not a list (type: {type(stats).__name__})"
+        )
 
-    # We requested merged stats in CLI but didn't find them - error
-    raise DidIntegrationError(
-        "Merged stats section not found in did result - "
-        "expected pull-requests-merged or merge-requests-merged"
-    )
+    # did SDK uses Issue type for both PRs and MRs
+    return stats
 
 
 def _validate_and_extract_user_stats(result: object) -> object:
@@ -337,20 +602,20 @@ def _validate_and_extract_user_stats(result: object) -> object:
         )
 
     # Validate first element
-    if not result[0]:
+    first = result[0]
+    if not first:
         raise DidIntegrationError("First element of did result is None or falsy")
 
-    # Extract users list - first element should be a list
+    # Extract the first user - first element should be a list, but any
+    # iterable works and only its first item is consumed
     try:
-        users_list = result[0] if isinstance(result[0], list) else list(result[0])
+        return next(iter(first))
+    except StopIteration:
+        raise DidIntegrationError("Users list in did result is empty") from None
     except TypeError as e:
         raise DidIntegrationError(
-            f"First element of did result is not iterable: {type(result[0]).__name__}"
+            f"First element of did result is not iterable: {type(first).__name__}"
         ) from e
-    if len(users_list) == 0:
-        raise DidIntegrationError("Users list in did result is empty")
-
-    return users_list[0]
 
 
 def _is_merged_stat(stat: object) -> bool:
@@ -365,40 +630,70 @@ def _is_merged_stat(stat: object) -> bool:
     if not hasattr(stat, "stats"):
         return False
 
-    class_name_lower = stat.__class__.__name__.lower()
-    return MERGED_STAT_KEYWORDS[0] in class_name_lower and (
-        MERGED_STAT_KEYWORDS[1] in class_name_lower
-        or MERGED_STAT_KEYWORDS[2] in class_name_lower
+    class_name = stat.__class__.__name__.lower()
+    return MERGED_KEYWORD in class_name and (
+        PULL_KEYWORD in class_name or MERGE_KEYWORD in class_name
     )
 
 
-def _convert_stats_to_changes(stats: list[Issue]) -> list[Change]:
+def _convert_stats_to_changes(
+    stats: Iterable[Issue], repositories: _Repositories | None = None
+) -> list[Change]:
     """Convert did stats to Change objects.
 
+    Stats are consumed lazily, so any iterable (including a generator) can be
+    passed without materializing it first.
+
     Args:
-        stats: List of Issue objects from did SDK (used for both PRs and MRs)
+        stats: Issue objects from did SDK (used for both PRs and MRs)
+        repositories: Repository objects to reuse; a new mapping shared by
+            this batch only when omitted
 
     Returns:
         List of successfully converted Change objects
     """
-    changes: list[Change] = []
+    if repositories is None:
+        repositories = {}
+    return list(_iter_valid_changes(stats, repositories))
+
+
+def _iter_valid_changes(
+    stats: Iterable[Issue], repositories: _Repositories
+) -> Iterator[Change]:
+    """Yield Change objects for stats that convert, skipping invalid ones.
+
+    Args:
+        stats: Issue objects from did SDK (used for both PRs and MRs)
+        repositories: Repository objects shared by the converted changes
+
+    Yields:
+        Successfully converted Change objects
+    """
+    # Local names avoid a global lookup per stat in the loop below
+    convert = _convert_to_change
+    invalid_stat_error = InvalidStatDataError
     for stat in stats:
         try:
-            change = _convert_to_change(stat)
-            changes.append(change)
-        except InvalidStatDataError as e:
-            # Log expected data validation issues as warnings
-            stat_type = type(stat).__name__
-            # Log all available attributes for debugging
-            attrs = [a for a in dir(stat) if not a.startswith("_")]
-            logger.warning(
-                "Skipping invalid stat: %s (stat type: %s, attrs: %s)",
-                e,
-                stat_type,
-                attrs,
-            )
+            change = convert(stat, repositories)
+        except invalid_stat_error as e:
+            # Log expected data validation issues as warnings; the attribute
+            # listing is costly, so it is only added when debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                attrs = [a for a in dir(stat) if not a.startswith("_")]
+                logger.warning(
+                    "Skipping invalid stat: %s (stat type: %s, attrs: %s)",
+                    e,
+                    stat.__class__.__name__,
+                    attrs,
+                )
+            else:
+                logger.warning(
+                    "Skipping invalid stat: %s (stat type: %s)",
+                    e,
+                    stat.__class__.__name__,
+                )
             continue
-    return changes
+        yield change
 
 
 def _check_did_stderr(stderr_content: str, provider_name: str) -> None:
@@ -421,19 +716,21 @@ def _check_did_stderr(stderr_content: str, provider_name: str) -> None:
     )
 
     # If stderr contains error indicators, raise exception
-    if any(
-        keyword in stderr_content.lower() for keyword in ["error", "fail", "exception"]
-    ):
+    if _STDERR_ERROR_RE.search(stderr_content):
         raise DidIntegrationError(
             f"did CLI reported errors for provider '{provider_name}': {stderr_content}"
         )
 
 
-def _convert_to_change(stat: object) -> Change:
+def _convert_to_change(
+    stat: object, repositories: _Repositories | None = None
+) -> Change:
     """Convert a did stat object into a Change object.
 
     Args:
         stat: A did stat object (Issue or MergeRequestMerged from did plugins)
+        repositories: Repository objects to reuse for changes in the same
+            repository; a fresh Repository is built when omitted
 
     Returns:
         Change object
@@ -441,30 +738,35 @@ def _convert_to_change(stat: object) -> Change:
     Raises:
         InvalidStatDataError: If required data is missing or invalid
     """
-    # Handle GitLab MergedRequest objects (different structure)
-    if isinstance(stat, MergedRequest):
-        return _convert_gitlab_mr(stat)
+    # Exact type lookup covers real did stats; subclasses (and test doubles)
+    # fall back to isinstance checks in priority order
+    if repositories is None:
+        repositories = {}
 
-    # Handle GitHub Issue objects (used for PRs)
-    if isinstance(stat, Issue):
-        return _convert_github_pr(stat)
+    converter = _STAT_CONVERTERS.get(type(stat))
+    if converter is not None:
+        return converter(stat, repositories)
+
+    for stat_class, converter in _STAT_CONVERTERS.items():
+        if isinstance(stat, stat_class):
+            return converter(stat, repositories)
 
     # Unknown type - try to handle generically with logging
     stat_type = type(stat).__name__
     raise InvalidStatDataError(f"Unknown stat type: {stat_type}")
 
 
-def _convert_github_pr(stat: Issue) -> Change:
+def _convert_github_pr(stat: Issue, repositories: _Repositories) -> Change:
     """Convert a GitHub Issue (PR) to a Change object.
 
     GitHub Issue objects have:
     - owner, project, id, title as attributes
     - data dictionary with html_url
     """
-    owner = stat.owner
-    project = stat.project
-    number = stat.id
-    title = stat.title
+    try:
+        owner, project, number, title = _GITHUB_PR_FIELDS(stat)
+    except AttributeError as e:
+        raise InvalidStatDataError(f"Stat missing required attributes: {e}") from e
 
     # Validate required fields
     if not owner:
@@ -479,15 +781,16 @@ def _convert_github_pr(stat: Issue) -> Change:
         )
 
     # Get URL from data dict
-    if not hasattr(stat, "data") or not isinstance(stat.data, dict):
+    data = getattr(stat, "data", None)
+    if not isinstance(data, dict):
         raise InvalidStatDataError(f"Missing data dict for {owner}/{project}#{number}")
 
     # Debug: log available keys in data dict
     logger.debug(
-        f"GitHub PR {owner}/{project}#{number} data keys: {list(stat.data.keys())}"
+        "GitHub PR %s/%s#%s data keys: %s", owner, project, number, data.keys()
     )
 
-    url = stat.data.get("html_url")
+    url = data.get("html_url")
     if not url:
         raise InvalidStatDataError(
             f"Missing html_url in data dict for {owner}/{project}#{number}"
@@ -505,32 +808,23 @@ def _convert_github_pr(stat: Issue) -> Change:
     # Extract merged_at timestamp if available
     # GitHub Issue API embeds PR data in 'pull_request' object
     merged_at = None
-    pull_request_obj = stat.data.get("pull_request")
+    pull_request_obj = data.get("pull_request")
     if pull_request_obj and isinstance(pull_request_obj, dict):
         logger.debug(
-            f"GitHub PR {repo_path}#{number} pull_request keys: "
-            f"{list(pull_request_obj.keys())}"
+            "GitHub PR %s#%s pull_request keys: %s",
+            repo_path,
+            number,
+            pull_request_obj.keys(),
+        )
+        # GitHub provides ISO format timestamp
+        merged_at = _parse_merged_at(
+            pull_request_obj.get("merged_at"), f"GitHub PR {repo_path}#{number}"
         )
-        merged_at_str = pull_request_obj.get("merged_at")
-        logger.debug(f"GitHub PR {repo_path}#{number} merged_at value: {merged_at_str}")
-        if merged_at_str:
-            try:
-                # GitHub provides ISO format timestamp
-                merged_at = datetime.fromisoformat(merged_at_str.replace("Z", "+00:00"))
-                logger.debug(
-                    f"GitHub PR {repo_path}#{number} parsed merged_at: {merged_at}"
-                )
-            except (ValueError, AttributeError) as e:
-                logger.debug(f"Failed to parse merged_at for {repo_path}#{number}: {e}")
     else:
-        logger.debug(f"GitHub PR {repo_path}#{number} has no pull_request object")
+        logger.debug("GitHub PR %s#%s has no pull_request object", repo_path, number)
 
-    # Create Repository object
-    repository = Repository(
-        host=host,
-        path=repo_path,
-        provider_type="github",
-    )
+    # Reuse the Repository object shared by other changes in the same repo
+    repository = _get_repository(repositories, host, repo_path, "github")
 
     return Change(
         title=title,
@@ -540,7 +834,7 @@ def _convert_github_pr(stat: Issue) -> Change:
     )
 
 
-def _convert_gitlab_mr(stat: MergedRequest) -> Change:
+def _convert_gitlab_mr(stat: MergedRequest, repositories: _Repositories) -> Change:
     """Convert a GitLab MergeRequestMerged to a Change object.
 
     GitLab MergedRequest objects have:
@@ -558,8 +852,12 @@ def _convert_gitlab_mr(stat: MergedRequest) -> Change:
     if not number:
         raise InvalidStatDataError("Missing iid for GitLab MR")
 
+    try:
+        project_dict, stat_data = _GITLAB_MR_FIELDS(stat)
+    except AttributeError as e:
+        raise InvalidStatDataError(f"Stat missing required attributes: {e}") from e
+
     # Get project path from project dict
-    project_dict = stat.project
     if not isinstance(project_dict, dict):
         raise InvalidStatDataError(
             f"Expected project dict, got {type(project_dict).__name__}"
@@ -570,14 +868,13 @@ def _convert_gitlab_mr(stat: MergedRequest) -> Change:
         raise InvalidStatDataError("Missing path_with_namespace in project dict")
 
     # Get title from data dict
-    stat_data = stat.data
     if not isinstance(stat_data, dict):
         raise InvalidStatDataError(
             f"Expected data dict, got {type(stat_data).__name__}"
         )
 
     # Debug: log available keys in data dict
-    logger.debug(f"GitLab MR {repo_path}!{number} data keys: {list(stat_data.keys())}")
+    logger.debug("GitLab MR %s!%s data keys: %s", repo_path, number, stat_data.keys())
 
     if "title" not in stat_data:
         raise InvalidStatDataError(f"Missing title for {repo_path}!{number}")
@@ -586,11 +883,15 @@ def _convert_gitlab_mr(stat: MergedRequest) -> Change:
         raise InvalidStatDataError(f"Empty title for {repo_path}!{number}")
 
     # Get GitLab instance URL from gitlabapi
-    if not hasattr(stat, "gitlabapi") or not hasattr(stat.gitlabapi, "url"):
+    gitlab_url = getattr(getattr(stat, "gitlabapi", None), "url", _MISSING)
+    if gitlab_url is _MISSING:
         raise InvalidStatDataError(f"Missing gitlabapi.url for {repo_path}!{number}")
-    gitlab_url = stat.gitlabapi.url
     if not gitlab_url:
         raise InvalidStatDataError(f"Empty gitlabapi.url for {repo_path}!{number}")
+    if not isinstance(gitlab_url, str):
+        raise InvalidStatDataError(
+            f"Expected gitlabapi.url string, got {type(gitlab_url).__name__}"
+        )
 
     # Extract host from GitLab URL
     host = _extract_host_from_url(gitlab_url)
@@ -599,26 +900,14 @@ def _convert_gitlab_mr(stat: MergedRequest) -> Change:
     title = _clean_emoji(title)
 
     # Extract merged_at timestamp if available
-    merged_at = None
-    merged_at_str = stat_data.get("merged_at")
-    logger.debug(f"GitLab MR {repo_path}!{number} merged_at value: {merged_at_str}")
-    if merged_at_str:
-        try:
-            # GitLab provides ISO format timestamp
-            merged_at = datetime.fromisoformat(merged_at_str.replace("Z", "+00:00"))
-            logger.debug(
-                f"GitLab MR {repo_path}!{number} parsed merged_at: {merged_at}"
-            )
-        except (ValueError, AttributeError) as e:
-            logger.debug(f"Failed to parse merged_at for {repo_path}!{number}: {e}")
-
-    # Create Repository object
-    repository = Repository(
-        host=host,
-        path=repo_path,
-        provider_type="gitlab",
+    # GitLab provides ISO format timestamp
+    merged_at = _parse_merged_at(
+        stat_data.get("merged_at"), f"GitLab MR {repo_path}!{number}"
     )
 
+    # Reuse the Repository object shared by other changes in the same repo
+    repository = _get_repository(repositories, host, repo_path, "gitlab")
+
     return Change(
         title=title,
         repository=repository,
@@ -627,6 +916,65 @@ def _convert_gitlab_mr(stat: MergedRequest) -> Change:
     )
 
 
+# Stat converters by did stat class; GitLab MergedRequest first (different
+# structure), then GitHub Issue (used for PRs)
+_STAT_CONVERTERS: dict[type, Callable[[Any, _Repositories], Change]] = {
+    MergedRequest: _convert_gitlab_mr,
+    Issue: _convert_github_pr,
+}
+
+
+def _get_repository(
+    repositories: _Repositories,
+    host: str,
+    path: str,
+    provider_type: Literal["github", "gitlab"],
+) -> Repository:
+    """Get the shared Repository object for the given host and path.
+
+    Args:
+        repositories: Repository objects created so far, updated in place
+        host: Repository host (e.g., 'github.com')
+        path: Repository path (e.g., 'owner/repo')
+        provider_type: Provider type ("github" or "gitlab")
+
+    Returns:
+        Repository instance, created on first use
+    """
+    key = (host, path, provider_type)
+    repository = repositories.get(key)
+    if repository is None:
+        repository = repositories.setdefault(
+            key, Repository(host=host, path=path, provider_type=provider_type)
+        )
+    return repository
+
+
+def _parse_merged_at(value: object, label: str) -> datetime | None:
+    """Parse an ISO format merged_at timestamp from GitHub/GitLab data.
+
+    Args:
+        value: Raw merged_at value (may be missing or malformed)
+        label: Change label for debug logs (e.g., "GitHub PR owner/repo#1")
+
+    Returns:
+        Parsed timestamp, or None if missing or unparseable
+    """
+    logger.debug("%s merged_at value: %s", label, value)
+    if not value:
+        return None
+    if not isinstance(value, str):
+        logger.debug("Failed to parse merged_at for %s: not a string", label)
+        return None
+    try:
+        merged_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError as e:
+        logger.debug("Failed to parse merged_at for %s: %s", label, e)
+        return None
+    logger.debug("%s parsed merged_at: %s", label, merged_at)
+    return merged_at
+
+
 def _extract_host_from_url(url: str) -> str:
     """Extract host from a URL using urllib.parse.
 
@@ -659,14 +1007,19 @@ def _clean_emoji(title: str) -> str:
     Returns:
         Title with emoji codes removed and whitespace cleaned
     """
-    # Remove emoji codes (e.g., :rocket:, :bug:, :sparkles:, :100:, :+1:)
-    # Matches word characters, digits, plus signs, and hyphens
-    cleaned = re.sub(r":[\w+-]+:", "", title, flags=re.IGNORECASE)
+    # Most titles carry no emoji code at all - skip the regex engine for them
+    cleaned = _EMOJI_RE.sub("", title) if ":" in title else title
 
-    # Strip leading/trailing whitespace and collapse multiple spaces
-    return " ".join(cleaned.split())
+    # Strip leading/trailing whitespace and collapse multiple spaces. Every
+    # whitespace character other than a plain space is non-printable, so most
+    # titles are already normalized once stripped and need no split/join.
+    cleaned = cleaned.strip()
+    if "  " in cleaned or not cleaned.isprintable():
+        cleaned = " ".join(cleaned.split())
+    return cleaned
 
 
+@functools.lru_cache(maxsize=32)
 def _determine_provider_type(host: str) -> Literal["github", "gitlab"]:
     """Determine provider type from host name.
 
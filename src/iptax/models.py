@@ -4,16 +4,19 @@ This module defines all data models used throughout the iptax application,
 including configuration settings, report data, and AI filtering structures.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import UTC, date, datetime
 from enum import Enum
 from pathlib import Path
-from typing import Annotated, Literal
+from types import MappingProxyType
+from typing import Annotated, ClassVar, Literal
 
 import yaml
 from pydantic import (
     BaseModel,
     BeforeValidator,
+    ConfigDict,
     Discriminator,
     Field,
     ValidatorFunctionWrapHandler,
@@ -45,38 +48,67 @@ class Fields:
 
         # Access default value
         default_name = Fields(MyConfig).name.default  # Returns "default_name"
+
+    One accessor is shared per model class, and resolved FieldInfo objects
+    are stored on it, so repeated lookups are plain attribute reads.
     """
 
+    _instances: ClassVar[dict[type[BaseModel], "Fields"]] = {}
+
+    def __new__(cls, model_class: type[BaseModel]) -> "Fields":
+        """Return the shared accessor for a Pydantic model class."""
+        instance = cls._instances.get(model_class)
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instances[model_class] = instance
+        return instance
+
     def __init__(self, model_class: type[BaseModel]) -> None:
         """Initialize the accessor with a Pydantic model class."""
         self._model_class = model_class
 
     def __getattr__(self, name: str) -> FieldInfo:
         """Provide access to field info via attribute access."""
-        return self._model_class.model_fields[name]
+        info = self._model_class.model_fields[name]
+        # Later lookups of this field find it in the instance dict and
+        # never reach __getattr__ again
+        self.__dict__[name] = info
+        return info
 
 
 # Constants
 MAX_PERCENTAGE = 100
 
-# Bilingual month names for report generation
-MONTH_NAMES_BILINGUAL = {
-    "01": ("January", "Styczeń"),
-    "02": ("February", "Luty"),
-    "03": ("March", "Marzec"),
-    "04": ("April", "Kwiecień"),
-    "05": ("May", "Maj"),
-    "06": ("June", "Czerwiec"),
-    "07": ("July", "Lipiec"),
-    "08": ("August", "Sierpień"),
-    "09": ("September", "Wrzesień"),
-    "10": ("October", "Październik"),
-    "11": ("November", "Listopad"),
-    "12": ("December", "Grudzień"),
-}
-
-
-@dataclass(frozen=True)
+# Prefer the libyaml-backed C parser and emitter when PyYAML was built with it
+_YAML_LOADER: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER: type[yaml.SafeDumper] = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Bilingual month names for report generation, indexed by month number - 1
+MONTH_NAMES_BILINGUAL: tuple[tuple[str, str], ...] = (
+    ("January", "Styczeń"),
+    ("February", "Luty"),
+    ("March", "Marzec"),
+    ("April", "Kwiecień"),
+    ("May", "Maj"),
+    ("June", "Czerwiec"),
+    ("July", "Lipiec"),
+    ("August", "Sierpień"),
+    ("September", "Wrzesień"),
+    ("October", "Październik"),
+    ("November", "Listopad"),
+    ("December", "Grudzień"),
+)
+UNKNOWN_MONTH_NAME_BILINGUAL = ("Unknown", "Nieznany")
+# Only a two-digit "MM" part of a YYYY-MM month names a month
+_MONTH_DIGITS = 2
+
+
+def _utcnow() -> datetime:
+    """Return the current time as an aware UTC datetime (model default factory)."""
+    return datetime.now(UTC)
+
+
+@dataclass(frozen=True, slots=True)
 class ReportDateRanges:
     """Date ranges for a report.
 
@@ -336,9 +368,15 @@ class DisabledAIConfig(BaseModel):
     All changes will require manual review.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     provider: Literal["disabled"] = "disabled"
 
 
+# Shared instance, safe to reuse since DisabledAIConfig is immutable
+DISABLED_AI_CONFIG = DisabledAIConfig()
+
+
 # Discriminated union for AI provider configs
 AIProviderConfig = Annotated[
     GeminiProviderConfig | VertexAIProviderConfig | DisabledAIConfig,
@@ -410,6 +448,8 @@ class WorkdayCalendarEntry(BaseModel):
     Can be work hours, PTO, or holiday.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     entry_date: date = Field(
         ...,
         description="Date of the entry",
@@ -491,6 +531,11 @@ class DidConfig(BaseModel):
         ...,  # Required, no default
         description="List of provider names to use (e.g., github.com, gitlab.cee)",
     )
+    max_parallel_providers: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum number of providers fetched concurrently",
+    )
 
     @field_validator("config_path", mode="wrap")
     @classmethod
@@ -548,7 +593,7 @@ class Settings(BaseModel):
         description="Report generation settings",
     )
     ai: AIProviderConfig = Field(
-        default=DisabledAIConfig(),
+        default=DISABLED_AI_CONFIG,
         description=(
             "AI provider configuration "
             "(use discriminated union based on provider type)"
@@ -577,11 +622,13 @@ class Settings(BaseModel):
             FileNotFoundError: If the settings file doesn't exist
             TypeError: If the YAML is invalid or validation fails
         """
-        if not path.exists():
-            raise FileNotFoundError(f"Settings file not found: {path}")
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Settings file not found: {path}") from e
 
-        with path.open(encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        # libyaml consumes bytes directly, no text decoding layer needed
+        data = yaml.load(raw, Loader=_YAML_LOADER)  # noqa: S506
 
         if not isinstance(data, dict):
             raise TypeError(
@@ -608,14 +655,16 @@ class Settings(BaseModel):
         ):
             data["ai"]["provider"] = self.ai.provider
 
-        # Convert to dict and write to file
-        with path.open("w", encoding="utf-8") as f:
-            yaml.safe_dump(
+        # Stream straight to a binary file, so libyaml encodes the output itself
+        with path.open("wb") as f:
+            yaml.dump(
                 data,
                 f,
+                Dumper=_YAML_DUMPER,
                 default_flow_style=False,
                 allow_unicode=True,
                 sort_keys=False,
+                encoding="utf-8",
             )
 
         # Set file permissions to 600 (owner read/write only)
@@ -629,6 +678,8 @@ class HistoryEntry(BaseModel):
     This prevents duplicate or missing changes between reports.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     first_change_date: date = Field(
         ...,
         description="The start date of the Did range used for this report",
@@ -650,6 +701,10 @@ class HistoryEntry(BaseModel):
     )
 
 
+# Code hosting platforms changes can come from
+ProviderType = Literal["github", "gitlab"]
+
+
 class Repository(BaseModel):
     """Repository information.
 
@@ -657,6 +712,8 @@ class Repository(BaseModel):
     and handles both GitHub (owner/repo) and GitLab (nested) formats.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     host: str = Field(
         ...,
         description="Repository host (e.g., github.com, gitlab.example.org)",
@@ -668,14 +725,14 @@ class Repository(BaseModel):
             "(e.g., 'owner/repo' or 'group/subgroup/repo' for GitLab)"
         ),
     )
-    provider_type: Literal["github", "gitlab"] = Field(
+    provider_type: ProviderType = Field(
         ...,
         description="Provider type (github or gitlab)",
     )
 
     @classmethod
     def from_full_path(
-        cls, host: str, path: str, provider_type: Literal["github", "gitlab"]
+        cls, host: str, path: str, provider_type: ProviderType
     ) -> "Repository":
         """Create a Repository from host and path.
 
@@ -714,6 +771,21 @@ class Repository(BaseModel):
         return self.get_display_name()
 
 
+# Per-provider URL route and reference symbol for a change number
+_CHANGE_URL_ROUTES: Mapping[ProviderType, str] = MappingProxyType(
+    {
+        "github": "pull",
+        "gitlab": "-/merge_requests",
+    }
+)
+_CHANGE_REFERENCE_SYMBOLS: Mapping[ProviderType, str] = MappingProxyType(
+    {
+        "github": "#",
+        "gitlab": "!",
+    }
+)
+
+
 class Change(BaseModel):
     """A code change (PR/MR) from the did SDK.
 
@@ -722,6 +794,8 @@ class Change(BaseModel):
     to avoid redundancy while allowing proper URL construction.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(
         ...,
         description="PR/MR title (cleaned of emoji)",
@@ -758,12 +832,8 @@ class Change(BaseModel):
         Returns:
             Full URL to the change
         """
-        base_url = self.repository.get_url()
-
-        if self.repository.provider_type == "github":
-            return f"{base_url}/pull/{self.number}"
-        # gitlab
-        return f"{base_url}/-/merge_requests/{self.number}"
+        route = _CHANGE_URL_ROUTES[self.repository.provider_type]
+        return f"{self.repository.get_url()}/{route}/{self.number}"
 
     def get_display_reference(self) -> str:
         """Get a short display reference for the change.
@@ -772,7 +842,7 @@ class Change(BaseModel):
             String in format "repo#number" for GitHub (e.g., "owner/repo#123")
             or "repo!number" for GitLab (e.g., "group/repo!456")
         """
-        symbol = "!" if self.repository.provider_type == "gitlab" else "#"
+        symbol = _CHANGE_REFERENCE_SYMBOLS[self.repository.provider_type]
         return f"{self.repository.path}{symbol}{self.number}"
 
 
@@ -810,7 +880,7 @@ class Judgment(BaseModel):
     )
     product: str = Field(..., description="Product name this judgment is for")
     timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(UTC),
+        default_factory=_utcnow,
         description="When this judgment was made (UTC)",
     )
     ai_provider: str = Field(
@@ -874,7 +944,7 @@ class InFlightReport(BaseModel):
         description="End date for Did changes (typically today)",
     )
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(UTC),
+        default_factory=_utcnow,
         description="When this in-flight report was created (UTC)",
     )
     changes: list[Change] = Field(
@@ -1034,15 +1104,22 @@ class ReportData(BaseModel):
             This file must be saved with UTF-8 encoding to properly handle
             Polish characters in month names.
         """
-        year, month = self.month.split("-")
-        en, pl = MONTH_NAMES_BILINGUAL.get(month, ("Unknown", "Nieznany"))
+        year, _, month = self.month.partition("-")
+        index = (
+            int(month) - 1 if len(month) == _MONTH_DIGITS and month.isdecimal() else -1
+        )
+        en, pl = (
+            MONTH_NAMES_BILINGUAL[index]
+            if 0 <= index < len(MONTH_NAMES_BILINGUAL)
+            else UNKNOWN_MONTH_NAME_BILINGUAL
+        )
         return f"{en} {year}", f"{pl} {year}"
 
 
 # Cache statistics models
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AICacheStats:
     """AI judgment cache statistics for display."""
 
@@ -1057,17 +1134,17 @@ class AICacheStats:
     cache_size_bytes: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HistoryCacheStats:
     """Report history statistics for display."""
 
     total_reports: int
-    entries: dict[str, HistoryEntry]
+    entries: Mapping[str, HistoryEntry]
     history_path: Path
     history_size_bytes: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InflightCacheStats:
     """In-flight cache statistics for display."""
 
@@ -314,7 +314,7 @@ def get_did_range(month: str) -> tuple[date, date]:
     end_date = _calculate_did_end_date(ctx)
 
     # Validate range
-    range_days = (end_date - start_date).days + 1
+    range_days = end_date.toordinal() - start_date.toordinal() + 1
     if range_days < MIN_RANGE_DAYS:
         raise DateRangeError(
             f"Date range too short ({range_days} days). "
@@ -4,6 +4,7 @@ This module provides centralized functions for resolving application directories
 that respect XDG Base Directory specification and HOME environment variable.
 """
 
+import functools
 import logging
 import os
 from datetime import date, datetime, timedelta
@@ -134,9 +135,12 @@ def get_today() -> date:
     return date.today()
 
 
+@functools.lru_cache(maxsize=256)
 def get_month_end_date(year: int, month: int) -> date:
     """Get the last day of a given month.
 
+    Results are memoized; the input space is small and dates are immutable.
+
     Args:
         year: Year (e.g., 2024)
         month: Month number (1-12)
@@ -3,6 +3,7 @@
 import json
 from datetime import UTC, date, datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -26,6 +27,13 @@ class TestHistoryManager:
         manager = HistoryManager(history_path=custom_path)
         assert manager.history_path == custom_path
 
+    @pytest.mark.unit
+    def test_uses_slots(self, tmp_path: Path) -> None:
+        """Test HistoryManager instances have no per-instance __dict__."""
+        manager = HistoryManager(history_path=tmp_path / "history.json")
+
+        assert not hasattr(manager, "__dict__")
+
     @pytest.mark.unit
     def test_init_with_default_path(
         self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
@@ -106,6 +114,17 @@ class TestHistoryLoad:
         assert manager._history == {}
         assert manager._loaded is True
 
+    @pytest.mark.unit
+    def test_load_parent_is_not_directory(self, tmp_path: Path) -> None:
+        """Test loading when a parent path component is a regular file."""
+        parent = tmp_path / "not-a-dir"
+        parent.write_text("", encoding="utf-8")
+        manager = HistoryManager(history_path=parent / "history.json")
+        manager.load()
+
+        assert manager._history == {}
+        assert manager._loaded is True
+
     @pytest.mark.unit
     def test_load_valid_json(self, tmp_path: Path) -> None:
         """Test loading valid JSON history."""
@@ -215,6 +234,30 @@ class TestHistorySave:
         assert manager2._history["2024-10"].first_change_date == date(2024, 9, 26)
         assert manager2._history["2024-10"].last_change_date == date(2024, 10, 25)
 
+    @pytest.mark.unit
+    def test_save_failure_keeps_previous_file(self, tmp_path: Path) -> None:
+        """Test a failed save leaves the old history and no temp file."""
+        history_file = tmp_path / "history.json"
+        history_file.write_text("{}\n", encoding="utf-8")
+        manager = HistoryManager(history_path=history_file)
+        manager._loaded = True
+        manager._history = {
+            "2024-10": HistoryEntry(
+                first_change_date=date(2024, 9, 26),
+                last_change_date=date(2024, 10, 25),
+                generated_at=datetime(2024, 10, 26, 10, 0, 0, tzinfo=UTC),
+            )
+        }
+
+        with (
+            patch.object(Path, "replace", side_effect=OSError("disk full")),
+            pytest.raises(HistoryError, match="disk full"),
+        ):
+            manager.save()
+
+        assert history_file.read_text(encoding="utf-8") == "{}\n"
+        assert list(tmp_path.iterdir()) == [history_file]
+
     @pytest.mark.unit
     def test_save_sets_permissions(self, tmp_path: Path) -> None:
         """Test save sets file permissions to 600."""
@@ -245,8 +288,8 @@ class TestHistoryGetAllEntries:
         assert entries == {}
 
     @pytest.mark.unit
-    def test_get_all_entries_returns_copy(self, tmp_path: Path) -> None:
-        """Test that get_all_entries returns a copy."""
+    def test_get_all_entries_returns_read_only_view(self, tmp_path: Path) -> None:
+        """Test that get_all_entries returns a read-only view."""
         manager = HistoryManager(history_path=tmp_path / "history.json")
         manager._loaded = True
         manager._history = {
@@ -258,11 +301,12 @@ class TestHistoryGetAllEntries:
         }
 
         entries = manager.get_all_entries()
-        entries["2024-11"] = HistoryEntry(
-            first_change_date=date(2024, 10, 26),
-            last_change_date=date(2024, 11, 25),
-            generated_at=datetime(2024, 11, 26, 10, 0, 0, tzinfo=UTC),
-        )
+        with pytest.raises(TypeError):
+            entries["2024-11"] = HistoryEntry(  # type: ignore[index]
+                first_change_date=date(2024, 10, 26),
+                last_change_date=date(2024, 11, 25),
+                generated_at=datetime(2024, 11, 26, 10, 0, 0, tzinfo=UTC),
+            )
 
         # Original should be unchanged
         assert "2024-11" not in manager._history
@@ -302,6 +346,21 @@ class TestHistoryAddEntry:
         assert manager._history["2024-10"].first_change_date == date(2024, 9, 26)
         assert manager._history["2024-10"].last_change_date == date(2024, 10, 25)
 
+    @pytest.mark.unit
+    def test_add_entry_uses_given_timestamp(self, tmp_path: Path) -> None:
+        """Test add_entry records an explicitly passed timestamp."""
+        manager = HistoryManager(history_path=tmp_path / "history.json")
+        manager._loaded = True
+        manager._history = {}
+        first = datetime(2024, 10, 26, 10, 0, 0, tzinfo=UTC)
+        second = datetime(2024, 10, 27, 10, 0, 0, tzinfo=UTC)
+
+        manager.add_entry("2024-10", date(2024, 9, 26), date(2024, 10, 25), now=first)
+        manager.add_entry("2024-10", date(2024, 9, 26), date(2024, 10, 25), now=second)
+
+        assert manager._history["2024-10"].generated_at == first
+        assert manager._history["2024-10"].regenerated_at == second
+
     @pytest.mark.unit
     def test_add_entry_invalid_month(self, tmp_path: Path) -> None:
         """Test adding entry with invalid month format."""
@@ -312,6 +371,33 @@ class TestHistoryAddEntry:
         with pytest.raises(ValueError, match="Invalid month format"):
             manager.add_entry("invalid", date(2024, 9, 26), date(2024, 10, 25))
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "month",
+        ["2024-13", "2024-00", "2024-001", "24-10", "2024/10", "0000-01", "2024-1a"],
+    )
+    def test_add_entry_rejects_malformed_month(
+        self, tmp_path: Path, month: str
+    ) -> None:
+        """Test add_entry rejects months strptime would reject."""
+        manager = HistoryManager(history_path=tmp_path / "history.json")
+        manager._loaded = True
+        manager._history = {}
+
+        with pytest.raises(ValueError, match="Invalid month format"):
+            manager.add_entry(month, date(2024, 9, 26), date(2024, 10, 25))
+
+    @pytest.mark.unit
+    def test_add_entry_normalizes_single_digit_month(self, tmp_path: Path) -> None:
+        """Test add_entry zero-pads a single-digit month."""
+        manager = HistoryManager(history_path=tmp_path / "history.json")
+        manager._loaded = True
+        manager._history = {}
+
+        manager.add_entry("2024-1", date(2023, 12, 26), date(2024, 1, 25))
+
+        assert "2024-01" in manager._history
+
     @pytest.mark.unit
     def test_add_entry_auto_loads(self, tmp_path: Path) -> None:
         """Test add_entry auto-loads if not loaded."""
@@ -186,6 +186,28 @@ class TestInFlightCache:
         # exists() should return True for compatible schema
         assert cache.exists("2024-12")
 
+    def test_load_incompatible_schema_returns_none(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test load ignores a cache written with an older schema."""
+        cache = InFlightCache(cache_dir=tmp_path)
+        (tmp_path / "2024-11.json").write_text(
+            '{"month": "2024-11", "workday_start": "2024-11-01"}'
+        )
+
+        assert cache.load("2024-11") is None
+        assert "Incompatible cache schema version" in caplog.text
+
+    def test_load_corrupted_file_returns_none(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test load ignores a cache file that is not valid JSON."""
+        cache = InFlightCache(cache_dir=tmp_path)
+        (tmp_path / "2024-11.json").write_text("not json {{{")
+
+        assert cache.load("2024-11") is None
+        assert "Corrupted cache file" in caplog.text
+
     def test_save_creates_directory(self, tmp_path: Path) -> None:
         """Test that save creates cache directory if needed."""
         cache_dir = tmp_path / "subdir" / "cache"
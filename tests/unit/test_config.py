@@ -11,6 +11,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 import yaml
+from did.base import Config as DidSdkConfig
 
 from iptax.config import (
     ConfigError,
@@ -187,6 +188,26 @@ class TestConfigurationLoading:
 
         assert "Invalid configuration" in str(exc_info.value)
 
+    @pytest.mark.parametrize("section", ["ai", "employee", "did"])
+    def test_load_settings_with_null_section(self, tmp_path, section):
+        """Test that an empty YAML section raises ConfigError, not a traceback."""
+        did_config_file = tmp_path / "did-config"
+        did_config_file.write_text("[general]\n[github]\ntype = github\n")
+        settings_data = {
+            "employee": {"name": "John Doe", "supervisor": "Jane Smith"},
+            "product": {"name": "Test Product"},
+            "ai": {"provider": "disabled"},
+            "did": {"config_path": str(did_config_file), "providers": ["github"]},
+        }
+        settings_data[section] = None
+        settings_file = tmp_path / "settings.yaml"
+        settings_file.write_text(yaml.safe_dump(settings_data))
+
+        configurator = Configurator(settings_path=settings_file)
+
+        with pytest.raises(ConfigError, match="Invalid configuration"):
+            configurator.load()
+
     def test_load_settings_convenience_function(self, tmp_path, monkeypatch):
         """Test load_settings() convenience function."""
         # Create did config
@@ -235,6 +256,18 @@ class TestDidConfigValidation:
 
         assert result is True
 
+    def test_validate_did_config_detects_removed_file(self, tmp_path):
+        """Test validate_did_config() reports a file removed after validation."""
+        did_config = tmp_path / "did-config"
+        did_config.write_text("[general]\n")
+        configurator = Configurator(did_config_path=did_config)
+        assert configurator.validate_did_config() is True
+
+        did_config.unlink()
+
+        with pytest.raises(DidConfigError, match="did config file not found"):
+            configurator.validate_did_config()
+
     def test_validate_did_config_with_missing_file(self, tmp_path):
         """Test validate_did_config() raises DidConfigError when file missing."""
         missing_file = tmp_path / "nonexistent"
@@ -247,6 +280,28 @@ class TestDidConfigValidation:
         assert "did config file not found" in str(exc_info.value)
         assert "https://github.com/psss/did#setup" in str(exc_info.value)
 
+    def test_validate_did_config_with_file_as_parent_directory(self, tmp_path):
+        """Test a path below a regular file is reported as not found."""
+        parent_file = tmp_path / "not-a-dir"
+        parent_file.write_text("")
+
+        configurator = Configurator(did_config_path=parent_file / "config")
+
+        with pytest.raises(DidConfigError, match="did config file not found"):
+            configurator.validate_did_config()
+
+    def test_validate_did_config_with_io_error(self, tmp_path):
+        """Test other I/O failures are reported as DidConfigError."""
+        did_config = tmp_path / "did-config"
+        did_config.write_text("[general]\n")
+        configurator = Configurator(did_config_path=did_config)
+
+        with (
+            patch.object(Path, "open", side_effect=OSError(5, "I/O error")),
+            pytest.raises(DidConfigError, match="Cannot read did config file"),
+        ):
+            configurator.validate_did_config()
+
     def test_validate_did_config_with_directory_instead_of_file(self, tmp_path):
         """Test validate_did_config() raises error when path is directory."""
         directory = tmp_path / "did-dir"
@@ -259,6 +314,17 @@ class TestDidConfigValidation:
 
         assert "is not a file" in str(exc_info.value)
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="No FIFOs on Windows")
+    def test_validate_did_config_with_fifo_instead_of_file(self, tmp_path):
+        """Test validate_did_config() rejects a FIFO without blocking on it."""
+        fifo = tmp_path / "did-fifo"
+        os.mkfifo(fifo)
+
+        configurator = Configurator(did_config_path=fifo)
+
+        with pytest.raises(DidConfigError, match="is not a file"):
+            configurator.validate_did_config()
+
     @pytest.mark.skipif(
         sys.platform == "win32", reason="chmod(0o000) unreliable on Windows"
     )
@@ -367,6 +433,50 @@ type = gitlab
 
         assert "Failed to parse did config" in str(exc_info.value)
 
+    def test_list_did_providers_reuses_parsed_config(self, tmp_path):
+        """Test list_did_providers() doesn't re-parse an unchanged did config."""
+        did_config_file = tmp_path / "did-config"
+        did_config_file.write_text("[general]\n[github]\ntype = github\n")
+
+        configurator = Configurator(did_config_path=did_config_file)
+
+        with patch(
+            "iptax.config.base.DidSdkConfig", wraps=DidSdkConfig
+        ) as mock_sdk_config:
+            first = configurator.list_did_providers()
+            second = configurator.list_did_providers()
+
+        assert first == second == ["github"]
+        assert mock_sdk_config.call_count == 1
+        # did loads the file itself; its text is never handed over (and logged)
+        mock_sdk_config.assert_called_once_with(path=str(did_config_file))
+
+    def test_list_did_providers_cache_hit_skips_file_open(self, tmp_path):
+        """Test an already validated did config is not reopened on a cache hit."""
+        did_config_file = tmp_path / "did-config"
+        did_config_file.write_text("[general]\n[github]\ntype = github\n")
+        configurator = Configurator(did_config_path=did_config_file)
+        configurator.list_did_providers()
+
+        with patch.object(Path, "open", side_effect=AssertionError("opened")):
+            providers = configurator._list_did_providers_raw(already_validated=True)
+
+        assert providers == ["github"]
+
+    def test_list_did_providers_cache_hit_still_validates(self, tmp_path):
+        """Test a cached listing is not returned once the file is unreadable."""
+        did_config_file = tmp_path / "did-config"
+        did_config_file.write_text("[general]\n[github]\ntype = github\n")
+        configurator = Configurator(did_config_path=did_config_file)
+        configurator.list_did_providers()
+
+        # A chmod changes ctime only, so the cache key still matches
+        with (
+            patch.object(Path, "open", side_effect=PermissionError("denied")),
+            pytest.raises(DidConfigError, match="is not readable"),
+        ):
+            configurator.list_did_providers()
+
     def test_list_did_providers_convenience_function(self, isolated_home):
         """Test list_did_providers() convenience function."""
         did_config_file = isolated_home / ".did" / "config"
@@ -516,6 +626,49 @@ class TestCreateInteractiveConfig:
         assert settings.employee.name == "John Doe"
         assert settings.product.name == "Test Product"
 
+    def test_interactive_config_preserves_max_parallel_providers(self, tmp_path):
+        """Test re-running the wizard keeps a custom provider parallelism."""
+        did_config_file = tmp_path / "did-config"
+        did_config_file.write_text("[general]\n[github]\ntype = github\n")
+
+        settings_file = tmp_path / "settings.yaml"
+        Settings(
+            employee={"name": "Old Name", "supervisor": "Old Super"},
+            product={"name": "Old Product"},
+            did={
+                "config_path": str(did_config_file),
+                "providers": ["github"],
+                "max_parallel_providers": 2,
+            },
+        ).to_yaml_file(settings_file)
+
+        configurator = Configurator(
+            settings_path=settings_file,
+            did_config_path=did_config_file,
+        )
+
+        with (
+            patch("iptax.config.interactive.questionary.text") as mock_text,
+            patch("iptax.config.interactive.questionary.confirm") as mock_confirm,
+            patch("iptax.config.interactive.questionary.checkbox") as mock_checkbox,
+            patch("iptax.config.interactive.questionary.print"),
+        ):
+
+            # Accept every default offered by the wizard
+            def default_side_effect(_prompt: str, **kwargs: object) -> Mock:
+                mock = Mock()
+                mock.unsafe_ask.return_value = kwargs.get("default", False)
+                return mock
+
+            mock_text.side_effect = default_side_effect
+            mock_confirm.side_effect = default_side_effect
+            mock_checkbox.return_value.unsafe_ask.return_value = ["github"]
+
+            configurator.create(interactive=True)
+
+        settings = Settings.from_yaml_file(settings_file)
+        assert settings.did.max_parallel_providers == 2
+
     def test_interactive_config_with_gemini_ai(self, tmp_path):
         """Test interactive configuration with Gemini AI provider."""
         did_config_file = tmp_path / "did-config"
@@ -866,6 +1019,64 @@ class TestConfigFilePermissions:
         assert stat.S_IMODE(mode) == 0o600
 
 
+class TestWizardModule:
+    """Test the config wizard is served from a single module."""
+
+    def test_wizard_resolves_to_canonical_module(self):
+        """Test Configurator uses the one interactive module's wizard."""
+        from iptax.config import base, interactive
+
+        assert base.run_interactive_wizard is interactive.run_interactive_wizard
+        assert interactive.run_interactive_wizard.__module__ == (
+            "iptax.config.interactive"
+        )
+
+    @patch("iptax.config.interactive.questionary.print")
+    @patch("iptax.config.interactive.questionary.text")
+    def test_wizard_propagates_keyboard_interrupt(self, mock_text, _mock_print):
+        """Test Ctrl+C at a prompt aborts the wizard instead of continuing."""
+        from iptax.config.interactive import run_interactive_wizard
+
+        # ask() swallows Ctrl+C and returns None; unsafe_ask() re-raises it
+        mock_text.return_value.ask.return_value = None
+        mock_text.return_value.unsafe_ask.side_effect = KeyboardInterrupt
+        list_fn = Mock()
+
+        with pytest.raises(KeyboardInterrupt):
+            run_interactive_wizard(None, list_fn)
+
+        list_fn.assert_not_called()
+
+
+class TestWizardValidators:
+    """Test prompt answer validators used by the config wizard."""
+
+    @pytest.mark.parametrize("value", ["0", "42", "100"])
+    def test_validate_percent_accepts_range(self, value):
+        """Test whole numbers within 0-100 are accepted."""
+        from iptax.config.interactive import _validate_percent
+
+        assert _validate_percent(value) is True
+
+    @pytest.mark.parametrize(
+        "value", ["", "abc", "4.5", "-1", "101", " 5", "5 ", "+5", "1_0"]
+    )
+    def test_validate_percent_rejects_invalid(self, value):
+        """Test non-numbers and out-of-range values return the error message."""
+        from iptax.config.interactive import _validate_percent
+
+        assert _validate_percent(value) == "Must be 0-100"
+
+    def test_not_empty_rejects_blank(self):
+        """Test blank answers return the configured message."""
+        from iptax.config.interactive import _not_empty
+
+        validate = _not_empty("Name cannot be empty")
+
+        assert validate("  ") == "Name cannot be empty"
+        assert validate("John") is True
+
+
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
 
@@ -1,10 +1,21 @@
 """Unit tests for did integration module."""
 
+import io
 import logging
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime
 from pathlib import Path
+from typing import Any
 from unittest.mock import Mock, patch
 
+import did.base
 import pytest
 from did.plugins.github import Issue
 from did.plugins.gitlab import MergedRequest
@@ -19,11 +30,59 @@ from iptax.did import (
     _convert_to_change,
     _determine_provider_type,
     _fetch_provider_changes,
+    _load_did_config,
+    _OutputCapture,
+    _reset_did_config_cache,
+    _start_daemon_workers,
+    _ThreadOutputRouter,
     fetch_changes,
 )
+from iptax.models import (
+    DidConfig,
+    EmployeeInfo,
+    ProductConfig,
+    Repository,
+    Settings,
+)
+
+# Seconds a provider fetch in _SLOW_FETCH_SCRIPT takes to finish
+_SLOW_FETCH_SECONDS = 20
+_INTERRUPTED_EXIT_CODE = 130
+
+# Runs fetch_changes() with one slow provider; prints "fetching" once the
+# provider has started and exits with 130 on KeyboardInterrupt
+_SLOW_FETCH_SCRIPT = f"""
+import sys
+import time
+from datetime import date
+from unittest.mock import patch
+
+from iptax.did import fetch_changes
 from iptax.models import DidConfig, EmployeeInfo, ProductConfig, Settings
 
 
+def fetch(*_):
+    print("fetching", flush=True)
+    time.sleep({_SLOW_FETCH_SECONDS})
+    return []
+
+
+settings = Settings(
+    employee=EmployeeInfo(name="Test User", supervisor="Manager"),
+    product=ProductConfig(name="Product"),
+    did=DidConfig(config_path=sys.argv[1], providers=["github.com"]),
+)
+with (
+    patch("iptax.did._load_did_config"),
+    patch("iptax.did._fetch_provider_changes", side_effect=fetch),
+):
+    try:
+        fetch_changes(settings, date(2024, 1, 1), date(2024, 1, 31))
+    except KeyboardInterrupt:
+        sys.exit({_INTERRUPTED_EXIT_CODE})
+"""
+
+
 class TestCleanEmoji:
     """Test emoji cleaning functionality."""
 
@@ -53,6 +112,18 @@ class TestCleanEmoji:
         """Test title that becomes empty after emoji removal."""
         assert _clean_emoji(":rocket: :bug:") == ""
 
+    def test_clean_collapses_mixed_whitespace(self) -> None:
+        """Test tabs and newlines are collapsed into single spaces."""
+        assert _clean_emoji(" Fix\tthe\n  bug :bug:\n") == "Fix the bug"
+
+    def test_clean_no_emoji_collapses_spaces(self) -> None:
+        """Test titles without emoji codes still get whitespace collapsed."""
+        assert _clean_emoji("  Regular   title ") == "Regular title"
+
+    def test_clean_collapses_unicode_whitespace(self) -> None:
+        """Test non-ASCII whitespace is collapsed like plain spaces."""
+        assert _clean_emoji("Fix\u00a0the\u3000bug") == "Fix the bug"
+
     def test_clean_unicode_emoji_preserved(self) -> None:
         """Test that actual unicode emoji are preserved."""
         assert _clean_emoji("Add feature 🚀") == "Add feature 🚀"
@@ -90,6 +161,17 @@ class TestDetermineProviderType:
         assert _determine_provider_type("GitHub.Com") == "github"
         assert _determine_provider_type("GitLab.Com") == "gitlab"
 
+    def test_repeated_lookups_keep_per_host_results(self) -> None:
+        """Test interleaved lookups return each host's own provider type."""
+        hosts = ["gitlab.repeat.example.org", "github.repeat.example.org"] * 2
+
+        assert [_determine_provider_type(host) for host in hosts] == [
+            "gitlab",
+            "github",
+            "gitlab",
+            "github",
+        ]
+
 
 class TestDidIntegrationError:
     """Test DidIntegrationError exception."""
@@ -156,7 +238,7 @@ class TestGitHubPRMergedAtExtraction:
             },
         }
 
-        change = _convert_github_pr(stat)
+        change = _convert_github_pr(stat, {})
 
         assert change.merged_at is not None
         assert change.merged_at == datetime(
@@ -181,7 +263,7 @@ class TestGitHubPRMergedAtExtraction:
             "title": "Test PR",
         }
 
-        change = _convert_github_pr(stat)
+        change = _convert_github_pr(stat, {})
 
         assert change.merged_at is None
 
@@ -200,7 +282,7 @@ class TestGitHubPRMergedAtExtraction:
             },
         }
 
-        change = _convert_github_pr(stat)
+        change = _convert_github_pr(stat, {})
 
         assert change.merged_at is None
 
@@ -220,7 +302,7 @@ class TestGitHubPRMergedAtExtraction:
         }
 
         # Should not raise, just log and set merged_at to None
-        change = _convert_github_pr(stat)
+        change = _convert_github_pr(stat, {})
         assert change.merged_at is None
 
 
@@ -240,7 +322,7 @@ class TestGitLabMRMergedAtExtraction:
         gitlabapi_mock.url = "https://gitlab.com/group/project/-/merge_requests/1"
         stat.gitlabapi = gitlabapi_mock
 
-        change = _convert_gitlab_mr(stat)
+        change = _convert_gitlab_mr(stat, {})
 
         assert change.merged_at is not None
         assert change.merged_at == datetime(
@@ -265,7 +347,7 @@ class TestGitLabMRMergedAtExtraction:
         gitlabapi_mock.url = "https://gitlab.com/group/project/-/merge_requests/1"
         stat.gitlabapi = gitlabapi_mock
 
-        change = _convert_gitlab_mr(stat)
+        change = _convert_gitlab_mr(stat, {})
 
         assert change.merged_at is None
 
@@ -283,7 +365,7 @@ class TestGitLabMRMergedAtExtraction:
         stat.gitlabapi = gitlabapi_mock
 
         # Should not raise, just log and set merged_at to None
-        change = _convert_gitlab_mr(stat)
+        change = _convert_gitlab_mr(stat, {})
         assert change.merged_at is None
 
 
@@ -383,40 +465,86 @@ class TestConvertToChange:
 
         assert change.title == "Add feature"
 
+    def test_convert_shares_repository_between_changes(self) -> None:
+        """Test changes in the same repository share one Repository object."""
+        repositories: dict[tuple[str, str, str], Repository] = {}
+        first = _convert_to_change(_create_github_issue_mock(id_val=1), repositories)
+        second = _convert_to_change(_create_github_issue_mock(id_val=2), repositories)
+        other = _convert_to_change(
+            _create_github_issue_mock(project="other"), repositories
+        )
+
+        assert first.repository is second.repository
+        assert other.repository is not first.repository
+        assert other.repository.path == "owner/other"
+        assert len(repositories) == 2
+
+    def test_convert_without_mapping_keeps_no_state(self) -> None:
+        """Test standalone conversions don't share or retain Repository objects."""
+        first = _convert_to_change(_create_github_issue_mock(id_val=1))
+        second = _convert_to_change(_create_github_issue_mock(id_val=2))
+
+        assert first.repository == second.repository
+        assert first.repository is not second.repository
+
     def test_convert_missing_owner(self) -> None:
         """Test converting stat with missing owner raises error."""
         stat = _create_github_issue_mock(owner=None)
 
         with pytest.raises(InvalidStatDataError, match="Missing owner"):
-            _convert_github_pr(stat)
+            _convert_github_pr(stat, {})
 
     def test_convert_missing_project(self) -> None:
         """Test converting stat with missing project raises error."""
         stat = _create_github_issue_mock(project=None)
 
         with pytest.raises(InvalidStatDataError, match="Missing project"):
-            _convert_github_pr(stat)
+            _convert_github_pr(stat, {})
 
     def test_convert_missing_id(self) -> None:
         """Test converting stat with missing id raises error."""
         stat = _create_github_issue_mock(id_val=None)
 
         with pytest.raises(InvalidStatDataError, match="Missing id"):
-            _convert_github_pr(stat)
+            _convert_github_pr(stat, {})
 
     def test_convert_missing_title(self) -> None:
         """Test converting stat with missing title raises error."""
         stat = _create_github_issue_mock(title=None)
 
         with pytest.raises(InvalidStatDataError, match="Missing title"):
-            _convert_github_pr(stat)
+            _convert_github_pr(stat, {})
 
     def test_convert_empty_title(self) -> None:
         """Test converting stat with empty title raises error."""
         stat = _create_github_issue_mock(title="")
 
         with pytest.raises(InvalidStatDataError, match="Missing title"):
-            _convert_github_pr(stat)
+            _convert_github_pr(stat, {})
+
+    def test_convert_absent_title_attribute(self) -> None:
+        """Test converting stat without a title attribute raises error."""
+        stat = _create_github_issue_mock()
+        del stat.title
+
+        with pytest.raises(InvalidStatDataError, match="missing required attributes"):
+            _convert_github_pr(stat, {})
+
+    def test_convert_gitlab_missing_api_url(self) -> None:
+        """Test converting GitLab stat without gitlabapi.url raises error."""
+        stat = _create_gitlab_mr_mock()
+        del stat.gitlabapi.url
+
+        with pytest.raises(InvalidStatDataError, match=r"Missing gitlabapi\.url"):
+            _convert_gitlab_mr(stat, {})
+
+    def test_convert_gitlab_absent_data_attribute(self) -> None:
+        """Test converting GitLab stat without a data attribute raises error."""
+        stat = _create_gitlab_mr_mock()
+        del stat.data
+
+        with pytest.raises(InvalidStatDataError, match="missing required attributes"):
+            _convert_gitlab_mr(stat, {})
 
     def test_convert_invalid_id_type(self) -> None:
         """Test converting stat with non-numeric id raises Pydantic error."""
@@ -424,14 +552,14 @@ class TestConvertToChange:
 
         # Pydantic validates the Change model and raises ValidationError
         with pytest.raises(ValidationError, match="int_parsing"):
-            _convert_github_pr(stat)
+            _convert_github_pr(stat, {})
 
     def test_convert_zero_id(self) -> None:
         """Test converting stat with zero id raises error."""
         stat = _create_github_issue_mock(id_val=0)
 
         with pytest.raises(InvalidStatDataError, match="Missing id"):
-            _convert_github_pr(stat)
+            _convert_github_pr(stat, {})
 
     def test_convert_negative_id(self) -> None:
         """Test converting stat with negative id raises Pydantic error."""
@@ -439,7 +567,21 @@ class TestConvertToChange:
 
         # Pydantic validates the Change model and raises ValidationError for negative
         with pytest.raises(ValidationError, match="greater_than"):
-            _convert_github_pr(stat)
+            _convert_github_pr(stat, {})
+
+    def test_convert_exact_github_issue_type(self) -> None:
+        """Test a real did Issue instance is dispatched by its exact type."""
+        stat = Issue.__new__(Issue)
+        stat.owner = "octocat"
+        stat.project = "hello-world"
+        stat.id = 7
+        stat.title = "Real issue"
+        stat.data = {"html_url": "https://github.com/octocat/hello-world/pull/7"}
+
+        change = _convert_to_change(stat)
+
+        assert change.repository.provider_type == "github"
+        assert change.number == 7
 
     def test_convert_unknown_type_raises_error(self) -> None:
         """Test converting unknown stat type raises error."""
@@ -481,6 +623,15 @@ class TestFetchProviderChanges:
         assert len(changes) == 1
         assert changes[0].title == "PR title"
         assert changes[0].repository.provider_type == "github"
+        mock_did_main.assert_called_once_with(
+            [
+                "--github.com-pull-requests-merged",
+                "--since",
+                "2024-01-01",
+                "--until",
+                "2024-01-31",
+            ]
+        )
 
     @patch("iptax.did.did.cli.main")
     def test_fetch_gitlab_provider(self, mock_did_main: Mock) -> None:
@@ -656,6 +807,76 @@ class TestFetchProviderChanges:
         assert "Failed to call did.cli.main()" in str(exc_info.value)
         assert isinstance(exc_info.value.__cause__, RuntimeError)
 
+    @pytest.mark.parametrize("level", [logging.DEBUG, logging.INFO])
+    @patch("iptax.did.did.cli.main")
+    def test_fetch_logs_did_report_only_in_debug(
+        self, mock_did_main: Mock, level: int, caplog, capsys
+    ) -> None:
+        """Test did's printed report is logged in debug mode and dropped otherwise."""
+
+        def did_main(_argv: list[str]) -> tuple[list[Mock]]:
+            sys.stdout.write("did report\n")
+            return ([Mock(stats=[])],)
+
+        mock_did_main.side_effect = did_main
+
+        with caplog.at_level(level, logger="iptax.did"):
+            changes = _fetch_provider_changes(
+                "github.com", date(2024, 1, 1), date(2024, 1, 31)
+            )
+
+        assert changes == []
+        assert ("did report" in caplog.text) == (level == logging.DEBUG)
+        assert "did report" not in capsys.readouterr().out
+
+
+class TestConvertStatsToChanges:
+    """Test _convert_stats_to_changes function."""
+
+    def test_convert_stats_logs_skipped_stat(self, caplog) -> None:
+        """Test skipped invalid stats are reported with their type."""
+        from iptax.did import _convert_stats_to_changes
+
+        with caplog.at_level(logging.WARNING, logger="iptax.did"):
+            changes = _convert_stats_to_changes(
+                [_create_github_issue_mock(owner=None), _create_github_issue_mock()]
+            )
+
+        assert len(changes) == 1
+        assert "Skipping invalid stat: Missing owner field" in caplog.text
+        assert "stat type: Issue" in caplog.text
+
+    def test_convert_stats_accepts_generator(self) -> None:
+        """Test stats can be streamed from a generator."""
+        from iptax.did import _convert_stats_to_changes
+
+        stats = (_create_github_issue_mock(id_val=i) for i in range(1, 4))
+
+        changes = _convert_stats_to_changes(stats)
+
+        assert [change.number for change in changes] == [1, 2, 3]
+
+    def test_convert_stats_lists_attrs_only_when_debugging(self, caplog) -> None:
+        """Test the stat attribute listing is only built in debug mode."""
+        from iptax.did import _convert_stats_to_changes
+
+        stat = _create_github_issue_mock(owner=None)
+        with (
+            caplog.at_level(logging.WARNING, logger="iptax.did"),
+            patch("iptax.did.dir", create=True) as mock_dir,
+        ):
+            assert _convert_stats_to_changes([stat]) == []
+
+        mock_dir.assert_not_called()
+        assert "Skipping invalid stat" in caplog.text
+        assert "attrs:" not in caplog.text
+
+        caplog.clear()
+        with caplog.at_level(logging.DEBUG, logger="iptax.did"):
+            _convert_stats_to_changes([stat])
+
+        assert "attrs: [" in caplog.text
+
 
 class TestExtractMergedStats:
     """Test _extract_merged_stats function."""
@@ -747,6 +968,50 @@ class TestExtractMergedStats:
         ):
             _extract_merged_stats(result, "github.com")
 
+    def test_extract_merged_stat_stats_not_list(self) -> None:
+        """Test error when merged stat's stats attribute is not a list."""
+        from iptax.did import _extract_merged_stats
+
+        mock_merged_stat = Mock()
+        mock_merged_stat.__class__.__name__ = "PullRequestsMerged"
+        mock_merged_stat.stats = "not a list"
+
+        mock_provider_group = Mock()
+        mock_provider_group.__class__.__name__ = "GitHubStats"
+        mock_provider_group.stats = [mock_merged_stat]
+        mock_user = Mock()
+        mock_user.stats = [mock_provider_group]
+
+        with pytest.raises(DidIntegrationError, match="Merged stats is not a list"):
+            _extract_merged_stats(([mock_user],), "github.com")
+
+
+class TestFindProviderGroup:
+    """Test _find_provider_group function."""
+
+    def test_matches_group_of_provider_type(self) -> None:
+        """Test the group whose class name matches the provider is returned."""
+        from iptax.did import _find_provider_group
+
+        github_group = Mock()
+        github_group.__class__.__name__ = "GitHubStats"
+        gitlab_group = Mock()
+        gitlab_group.__class__.__name__ = "GitLabStats"
+
+        groups = [github_group, gitlab_group]
+
+        assert _find_provider_group(groups, "gitlab.cee") is gitlab_group
+        assert _find_provider_group(groups, "GitHub.com") is github_group
+
+    def test_unknown_provider_matches_nothing(self) -> None:
+        """Test a provider that is neither GitHub nor GitLab has no group."""
+        from iptax.did import _find_provider_group
+
+        group = Mock()
+        group.__class__.__name__ = "GitHubStats"
+
+        assert _find_provider_group([group], "jira.example.com") is None
+
 
 class TestValidateAndExtractUserStats:
     """Test _validate_and_extract_user_stats function."""
@@ -770,6 +1035,34 @@ class TestValidateAndExtractUserStats:
         ):
             _validate_and_extract_user_stats(result)
 
+    def test_validate_consumes_only_first_user(self) -> None:
+        """Test only the first user is taken from a lazy iterable."""
+        from iptax.did import _validate_and_extract_user_stats
+
+        consumed = []
+
+        def users() -> Iterator[str]:
+            for user in ("first", "second"):
+                consumed.append(user)
+                yield user
+
+        assert _validate_and_extract_user_stats((users(),)) == "first"
+        assert consumed == ["first"]
+
+    def test_validate_empty_users_iterable(self) -> None:
+        """Test error when a (truthy) users iterable yields nothing."""
+        from iptax.did import _validate_and_extract_user_stats
+
+        with pytest.raises(DidIntegrationError, match="Users list in did result"):
+            _validate_and_extract_user_stats((iter(()),))
+
+    def test_validate_non_iterable_users(self) -> None:
+        """Test error when the users element is not iterable."""
+        from iptax.did import _validate_and_extract_user_stats
+
+        with pytest.raises(DidIntegrationError, match="not iterable: int"):
+            _validate_and_extract_user_stats((5,))
+
 
 class TestIsMergedStat:
     """Test _is_merged_stat function."""
@@ -873,7 +1166,10 @@ class TestFetchChanges:
 
         mock_change1 = Mock()
         mock_change2 = Mock()
-        mock_fetch_provider.side_effect = [[mock_change1], [mock_change2]]
+        provider_changes = {"github.com": [mock_change1], "gitlab.com": [mock_change2]}
+        mock_fetch_provider.side_effect = lambda provider, *_: provider_changes[
+            provider
+        ]
 
         changes = fetch_changes(settings, date(2024, 1, 1), date(2024, 1, 31))
 
@@ -964,3 +1260,288 @@ class TestFetchChanges:
         changes = fetch_changes(settings, date(2024, 1, 1), date(2024, 1, 31))
 
         assert changes == []
+
+    @patch("iptax.did._fetch_provider_changes")
+    @patch("iptax.did.did.base.Config")
+    def test_fetch_changes_providers_run_concurrently(
+        self,
+        _mock_config: Mock,
+        mock_fetch_provider: Mock,
+        tmp_path: Path,
+    ) -> None:
+        """Test providers are fetched in parallel and kept in config order."""
+        config_path = tmp_path / "did.conf"
+        config_path.write_text("[general]\nemail = test@example.com\n")
+
+        settings = Settings(
+            employee=EmployeeInfo(name="Test User", supervisor="Manager"),
+            product=ProductConfig(name="Product"),
+            did=DidConfig(
+                config_path=str(config_path),
+                providers=["github.com", "gitlab.com"],
+            ),
+        )
+
+        # Each fetch waits for the other one - only passes when run in parallel
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch(provider: str, *_: object) -> list[str]:
+            barrier.wait()
+            return [provider]
+
+        mock_fetch_provider.side_effect = fetch
+
+        changes = fetch_changes(settings, date(2024, 1, 1), date(2024, 1, 31))
+
+        assert changes == ["github.com", "gitlab.com"]
+
+    @patch("iptax.did._fetch_provider_changes")
+    @patch("iptax.did.did.base.Config")
+    def test_fetch_changes_respects_parallelism_limit(
+        self,
+        _mock_config: Mock,
+        mock_fetch_provider: Mock,
+        tmp_path: Path,
+    ) -> None:
+        """Test max_parallel_providers caps concurrently running fetches."""
+        config_path = tmp_path / "did.conf"
+        config_path.write_text("[general]\nemail = test@example.com\n")
+
+        settings = Settings(
+            employee=EmployeeInfo(name="Test User", supervisor="Manager"),
+            product=ProductConfig(name="Product"),
+            did=DidConfig(
+                config_path=str(config_path),
+                providers=["github.com", "gitlab.com", "gitlab.cee"],
+                max_parallel_providers=1,
+            ),
+        )
+
+        threads = set()
+
+        def fetch(provider: str, *_: object) -> list[str]:
+            threads.add(threading.get_ident())
+            return [provider]
+
+        mock_fetch_provider.side_effect = fetch
+
+        changes = fetch_changes(settings, date(2024, 1, 1), date(2024, 1, 31))
+
+        assert changes == ["github.com", "gitlab.com", "gitlab.cee"]
+        assert len(threads) == 1
+
+    @patch("iptax.did.did.cli.main")
+    def test_concurrent_fetches_capture_output_per_thread(
+        self, mock_did_main: Mock
+    ) -> None:
+        """Test concurrent did runs keep their output apart and restore streams."""
+        original_stdout, original_stderr = sys.stdout, sys.stderr
+        barrier = threading.Barrier(2, timeout=5)
+
+        def did_main(argv: list[str]) -> tuple[()]:
+            barrier.wait()
+            sys.stderr.write(f"error in {argv[0]}\n")
+            barrier.wait()
+            return ()
+
+        mock_did_main.side_effect = did_main
+
+        def fetch(provider: str) -> str:
+            with pytest.raises(DidIntegrationError) as exc_info:
+                _fetch_provider_changes(provider, date(2024, 1, 1), date(2024, 1, 31))
+            return str(exc_info.value)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            errors = list(executor.map(fetch, ["github.com", "gitlab.com"]))
+
+        assert "github.com" in errors[0]
+        assert "gitlab.com" not in errors[0]
+        assert "gitlab.com" in errors[1]
+        assert "github.com" not in errors[1]
+        assert sys.stdout is original_stdout
+        assert sys.stderr is original_stderr
+
+    @patch("iptax.did._fetch_provider_changes")
+    @patch("iptax.did.did.base.Config")
+    def test_fetch_changes_interrupt_cancels_pending_providers(
+        self,
+        _mock_config: Mock,
+        mock_fetch_provider: Mock,
+        tmp_path: Path,
+    ) -> None:
+        """Test Ctrl+C returns at once and cancels providers not yet started."""
+        config_path = tmp_path / "did.conf"
+        config_path.write_text("[general]\nemail = test@example.com\n")
+
+        settings = Settings(
+            employee=EmployeeInfo(name="Test User", supervisor="Manager"),
+            product=ProductConfig(name="Product"),
+            did=DidConfig(
+                config_path=str(config_path),
+                providers=["github.com", "gitlab.com", "gitlab.cee"],
+                max_parallel_providers=1,
+            ),
+        )
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def fetch(provider: str, *_: object) -> list[str]:
+            started.set()
+            release.wait(timeout=5)
+            return [provider]
+
+        mock_fetch_provider.side_effect = fetch
+
+        futures: list[Future[list[str]]] = []
+
+        def start_workers(*args: Any) -> list[Future[list[str]]]:  # noqa: ANN401
+            futures.extend(_start_daemon_workers(*args))
+            return futures
+
+        def interrupt(*_args: object, **_kwargs: object) -> None:
+            # Ctrl+C arriving while the main thread waits for a provider
+            started.wait(timeout=5)
+            raise KeyboardInterrupt
+
+        try:
+            with (
+                patch("iptax.did._start_daemon_workers", start_workers),
+                patch.object(Future, "result", side_effect=interrupt),
+                pytest.raises(KeyboardInterrupt),
+            ):
+                fetch_changes(settings, date(2024, 1, 1), date(2024, 1, 31))
+
+            # Returned without waiting for the provider still in flight
+            assert futures[0].running()
+            assert futures[1].cancelled()
+            assert futures[2].cancelled()
+        finally:
+            release.set()
+
+        assert futures[0].result(timeout=5) == ["github.com"]
+        assert mock_fetch_provider.call_count == 1
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="needs POSIX signals")
+    def test_interrupted_fetch_lets_process_exit(self, tmp_path: Path) -> None:
+        """Test Ctrl+C exits the process without waiting for a running fetch."""
+        config_path = tmp_path / "did.conf"
+        config_path.write_text("[general]\nemail = test@example.com\n")
+        script = tmp_path / "fetch.py"
+        script.write_text(_SLOW_FETCH_SCRIPT)
+
+        process = subprocess.Popen(  # noqa: S603
+            [sys.executable, str(script), str(config_path)],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            assert process.stdout is not None
+            assert process.stdout.readline().strip() == "fetching"
+            interrupted_at = time.monotonic()
+            process.send_signal(signal.SIGINT)
+            returncode = process.wait(timeout=_SLOW_FETCH_SECONDS)
+            exit_delay = time.monotonic() - interrupted_at
+        finally:
+            process.kill()
+            process.wait()
+
+        assert returncode == _INTERRUPTED_EXIT_CODE
+        assert exit_delay < _SLOW_FETCH_SECONDS / 2
+
+
+class TestOutputCapture:
+    """Test _OutputCapture stream routing."""
+
+    def test_router_reports_original_console(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the installed router exposes the replaced stream's details."""
+        console = Mock(encoding="utf-8", errors="strict")
+        console.isatty.return_value = True
+        console.fileno.return_value = 1
+        monkeypatch.setattr(sys, "stdout", console)
+
+        with _OutputCapture().capture(io.StringIO(), io.StringIO()):
+            assert isinstance(sys.stdout, _ThreadOutputRouter)
+            assert sys.stdout.encoding == "utf-8"
+            assert sys.stdout.errors == "strict"
+            assert sys.stdout.isatty() is True
+            assert sys.stdout.fileno() == 1
+
+        assert sys.stdout is console
+
+    def test_keeps_streams_replaced_during_capture(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a stream swapped by other code while capturing is not undone."""
+        monkeypatch.setattr(sys, "stdout", sys.stdout)
+        monkeypatch.setattr(sys, "stderr", sys.stderr)
+        original_stderr = sys.stderr
+        replacement = io.StringIO()
+
+        with _OutputCapture().capture(io.StringIO(), io.StringIO()):
+            sys.stdout = replacement
+
+        assert sys.stdout is replacement
+        assert sys.stderr is original_stderr
+
+
+class TestLoadDidConfig:
+    """Test _load_did_config function."""
+
+    @pytest.fixture(autouse=True)
+    def isolate_did_config(self) -> Iterator[None]:
+        """Keep loaded configs from leaking into other tests."""
+        parser = did.base.Config.parser
+        _reset_did_config_cache()
+        yield
+        _reset_did_config_cache()
+        did.base.Config.parser = parser
+
+    def test_reuses_loaded_config(self, tmp_path: Path) -> None:
+        """Test unchanged config file is not parsed again."""
+        config_path = tmp_path / "did.conf"
+        config_path.write_text("[general]\nemail = test@example.com\n")
+
+        _load_did_config(str(config_path))
+        parser = did.base.Config.parser
+        _load_did_config(str(config_path))
+
+        assert did.base.Config.parser is parser
+
+    def test_reset_forces_reload(self, tmp_path: Path) -> None:
+        """Test resetting the cache parses the config file again."""
+        config_path = tmp_path / "did.conf"
+        config_path.write_text("[general]\nemail = test@example.com\n")
+
+        _load_did_config(str(config_path))
+        parser = did.base.Config.parser
+        _reset_did_config_cache()
+        _load_did_config(str(config_path))
+
+        assert did.base.Config.parser is not parser
+
+    def test_reloads_modified_config(self, tmp_path: Path) -> None:
+        """Test config file is parsed again after it changes on disk."""
+        config_path = tmp_path / "did.conf"
+        config_path.write_text("[general]\nemail = old@example.com\n")
+        _load_did_config(str(config_path))
+
+        config_path.write_text("[general]\nemail = new@example.com\n")
+        mtime_ns = config_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(config_path, ns=(mtime_ns, mtime_ns))
+        _load_did_config(str(config_path))
+
+        assert did.base.Config().email == "new@example.com"
+
+    def test_reloads_after_global_config_replaced(self, tmp_path: Path) -> None:
+        """Test config is loaded again when another config replaced it."""
+        config_path = tmp_path / "did.conf"
+        config_path.write_text("[general]\nemail = file@example.com\n")
+        _load_did_config(str(config_path))
+
+        did.base.Config(config="[general]\nemail = other@example.com\n")
+        _load_did_config(str(config_path))
+
+        assert did.base.Config().email == "file@example.com"
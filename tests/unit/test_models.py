@@ -9,6 +9,7 @@ import pytest
 from pydantic import ValidationError
 
 from iptax.models import (
+    DISABLED_AI_CONFIG,
     Change,
     DidConfig,
     DisabledAIConfig,
@@ -37,6 +38,20 @@ class TestFields:
 
         assert isinstance(accessor, Fields)
 
+    def test_fields_instance_shared_per_model(self):
+        """Test that Fields() reuses one accessor per model class."""
+        assert Fields(ReportConfig) is Fields(ReportConfig)
+        assert Fields(ReportConfig) is not Fields(DidConfig)
+
+    def test_resolved_field_info_is_memoized(self):
+        """Test that a resolved field is stored on the accessor."""
+        accessor = Fields(ReportConfig)
+
+        info = accessor.output_dir
+
+        assert accessor.__dict__["output_dir"] is info
+        assert info is ReportConfig.model_fields["output_dir"]
+
     def test_access_field_default_value(self):
         """Test accessing a field's default value."""
         accessor = Fields(ReportConfig)
@@ -455,6 +470,13 @@ class TestDisabledAIConfig:
         config = DisabledAIConfig()
         assert config.provider == "disabled"
 
+    def test_shared_instance_is_immutable(self):
+        """Test that the shared disabled config cannot be mutated."""
+        with pytest.raises(ValidationError):
+            DISABLED_AI_CONFIG.provider = "gemini"  # type: ignore[misc]
+
+        assert DisabledAIConfig() == DISABLED_AI_CONFIG
+
 
 class TestAIProviderConfigDiscriminatedUnion:
     """Test AI provider discriminated union functionality."""
@@ -686,6 +708,21 @@ class TestDidConfig:
 
         assert config.config_path == str(did_config)
 
+    def test_max_parallel_providers_must_be_positive(self, tmp_path):
+        """Test that max_parallel_providers defaults to 8 and rejects zero."""
+        did_config = tmp_path / "did_config"
+        did_config.write_text("[general]\n")
+
+        config = DidConfig(config_path=str(did_config), providers=["github.com"])
+        assert config.max_parallel_providers == 8
+
+        with pytest.raises(ValidationError):
+            DidConfig(
+                config_path=str(did_config),
+                providers=["github.com"],
+                max_parallel_providers=0,
+            )
+
     def test_config_path_validation_with_missing_file(self, tmp_path):
         """Test that config_path raises error for missing file."""
         missing_file = tmp_path / "nonexistent"
@@ -871,6 +908,50 @@ class TestChange:
         assert change.number == 123
         assert change.merged_at is None
 
+    def test_derived_strings_follow_model_copy(self):
+        """Test URL and identifiers reflect updated copies, not the original."""
+        repo = Repository(
+            host="gitlab.com",
+            path="group/sub/repo",
+            provider_type="gitlab",
+        )
+        change = Change(title="Fix", repository=repo, number=7)
+        assert (
+            change.get_url() == "https://gitlab.com/group/sub/repo/-/merge_requests/7"
+        )
+
+        updated = change.model_copy(update={"number": 8})
+        other_repo = repo.model_copy(update={"path": "group/other"})
+
+        assert (
+            updated.get_url() == "https://gitlab.com/group/sub/repo/-/merge_requests/8"
+        )
+        assert updated.get_change_id() == "gitlab.com/group/sub/repo#8"
+        assert updated.get_display_reference() == "group/sub/repo!8"
+        assert other_repo.get_display_name() == "group / other"
+        assert other_repo.get_url() == "https://gitlab.com/group/other"
+        assert "url" not in change.model_dump()
+        assert change == Change(title="Fix", repository=repo, number=7)
+
+    def test_change_url_tables_are_read_only(self):
+        """Test the per-provider route and symbol tables can't be mutated."""
+        from iptax.models import _CHANGE_REFERENCE_SYMBOLS, _CHANGE_URL_ROUTES
+
+        with pytest.raises(TypeError):
+            _CHANGE_URL_ROUTES["github"] = "pulls"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            _CHANGE_REFERENCE_SYMBOLS["gitlab"] = "#"  # type: ignore[index]
+
+    def test_change_is_frozen_and_hashable(self):
+        """Test changes reject assignment and can be used in sets."""
+        repo = Repository(host="github.com", path="owner/repo", provider_type="github")
+        change = Change(title="Fix", repository=repo, number=1)
+
+        with pytest.raises(ValidationError):
+            change.number = 2
+
+        assert {change, Change(title="Fix", repository=repo, number=1)} == {change}
+
     def test_change_with_merged_at(self):
         """Test creating a change with merged_at timestamp."""
         repo = Repository(
@@ -1386,6 +1467,38 @@ class TestReportData:
         assert en == "November 2024"
         assert pl == "Listopad 2024"
 
+    @pytest.mark.parametrize(
+        ("month", "expected"),
+        [
+            ("2024-01", ("January 2024", "Styczeń 2024")),
+            ("2024-12", ("December 2024", "Grudzień 2024")),
+            ("2024-13", ("Unknown 2024", "Nieznany 2024")),
+            ("2024-00", ("Unknown 2024", "Nieznany 2024")),
+            ("2024-xx", ("Unknown 2024", "Nieznany 2024")),
+            ("2024-1", ("Unknown 2024", "Nieznany 2024")),
+            ("2024-001", ("Unknown 2024", "Nieznany 2024")),
+        ],
+    )
+    def test_get_month_name_bilingual_edges(
+        self, month: str, expected: tuple[str, str]
+    ):
+        """Test bilingual month names at the table edges and out of range."""
+        report = ReportData(
+            month=month,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            changes_since=date(2023, 12, 26),
+            changes_until=date(2024, 1, 25),
+            total_hours=160,
+            creative_hours=128,
+            creative_percentage=80,
+            employee_name="John Doe",
+            supervisor_name="Jane Smith",
+            product_name="Test Product",
+        )
+
+        assert report.get_month_name_bilingual() == expected
+
     def test_hours_must_be_positive(self):
         """Test that hours must be greater than 0."""
         with pytest.raises(ValidationError) as exc_info: